@@ -11,6 +11,8 @@ Implements structured binary format with:
 import struct
 import time
 import os
+from array import array
+from micropython import const
 
 # CircuitPython doesn't have hashlib.sha256, so always use CRC32
 HAS_HASHLIB = False
@@ -32,26 +34,26 @@ HARDWARE_VERSION_MAJOR = 1
 HARDWARE_VERSION_MINOR = 0
 
 # Block types
-BLOCK_TYPE_SESSION_HEADER = 0x01
-BLOCK_TYPE_DATA = 0x02
-BLOCK_TYPE_SESSION_END = 0x03
-BLOCK_TYPE_HARDWARE_CONFIG = 0x04  # Hardware configuration block
+BLOCK_TYPE_SESSION_HEADER = const(0x01)
+BLOCK_TYPE_DATA = const(0x02)
+BLOCK_TYPE_SESSION_END = const(0x03)
+BLOCK_TYPE_HARDWARE_CONFIG = const(0x04)  # Hardware configuration block
 
 # Flush flags (bitmask)
-FLUSH_FLAG_TIME = 0x01      # Time-based flush (5 minutes)
-FLUSH_FLAG_SIZE = 0x02      # Buffer full
-FLUSH_FLAG_EVENT = 0x04     # High G-force event
-FLUSH_FLAG_MANUAL = 0x08    # Manual flush request
-FLUSH_FLAG_SHUTDOWN = 0x10  # System shutdown
+FLUSH_FLAG_TIME = const(0x01)      # Time-based flush (5 minutes)
+FLUSH_FLAG_SIZE = const(0x02)      # Buffer full
+FLUSH_FLAG_EVENT = const(0x04)     # High G-force event
+FLUSH_FLAG_MANUAL = const(0x08)    # Manual flush request
+FLUSH_FLAG_SHUTDOWN = const(0x10)  # System shutdown
 
 # Sample types
-SAMPLE_TYPE_ACCELEROMETER = 0x01
-SAMPLE_TYPE_GPS_FIX = 0x02
-SAMPLE_TYPE_GPS_SATELLITES = 0x03
-SAMPLE_TYPE_GYROSCOPE = 0x04
-SAMPLE_TYPE_MAGNETOMETER = 0x05
-SAMPLE_TYPE_OBD_PID = 0x10
-SAMPLE_TYPE_EVENT_MARKER = 0x20
+SAMPLE_TYPE_ACCELEROMETER = const(0x01)
+SAMPLE_TYPE_GPS_FIX = const(0x02)
+SAMPLE_TYPE_GPS_SATELLITES = const(0x03)
+SAMPLE_TYPE_GYROSCOPE = const(0x04)
+SAMPLE_TYPE_MAGNETOMETER = const(0x05)
+SAMPLE_TYPE_OBD_PID = const(0x10)
+SAMPLE_TYPE_EVENT_MARKER = const(0x20)
 
 # Weather conditions
 WEATHER_UNKNOWN = 0
@@ -67,6 +69,15 @@ MAX_SESSION_NAME = 64
 MAX_DRIVER_NAME = 32
 MAX_VEHICLE_ID = 24
 MAX_DATA_PAYLOAD = MAX_BLOCK_SIZE - 80  # Reserve space for headers
+SAMPLE_HEADER_SIZE = const(4)  # type (1) + offset (2) + length (1)
+
+# Data block header: magic, type, session ID, sequence, start/end timestamps,
+# flush flags, sample count, data size
+DATA_BLOCK_HEADER_FMT = '<4sB16sIQQBHH'
+
+# Session header (string lengths filled in per session): magic, type,
+# versions, timestamp, session ID, name/driver/vehicle, weather, temp, config CRC
+SESSION_HEADER_FMT = '<4sBBBBBQ16sB%dsB%dsB%dsBhI'
 
 MAX_HARDWARE_ITEMS = 32  # Max number of hardware items in config
 
@@ -92,7 +103,9 @@ CONN_TYPE_BUILTIN = 0x06
 
 # Flush thresholds
 FLUSH_TIME_THRESHOLD = 300  # 5 minutes in seconds
+FLUSH_SIZE_THRESHOLD = int(MAX_DATA_PAYLOAD * 0.9)  # 90% of block payload
 FLUSH_GFORCE_THRESHOLD = 3.0  # 3g event threshold
+FLUSH_GFORCE_THRESHOLD_SQ = FLUSH_GFORCE_THRESHOLD * FLUSH_GFORCE_THRESHOLD
 
 
 # =============================================================================
@@ -100,8 +113,8 @@ FLUSH_GFORCE_THRESHOLD = 3.0  # 3g event threshold
 # =============================================================================
 
 def _crc32_table():
-    """Generate CRC32 lookup table"""
-    table = []
+    """Generate CRC32 lookup table (256 x uint32, 1KB unboxed)"""
+    table = array('I', bytes(1024))
     for i in range(256):
         crc = i
         for _ in range(8):
@@ -109,22 +122,69 @@ def _crc32_table():
                 crc = (crc >> 1) ^ 0xEDB88320
             else:
                 crc >>= 1
-        table.append(crc)
+        table[i] = crc
     return table
 
+def _crc32_slice_tables(t0):
+    """Generate the three extra tables for slice-by-4 from the base table"""
+    tables = []
+    prev = t0
+    for _ in range(3):
+        table = array('I', bytes(1024))
+        for i in range(256):
+            crc = prev[i]
+            table[i] = (crc >> 8) ^ t0[crc & 0xFF]
+        tables.append(table)
+        prev = table
+    return tables
+
 _CRC32_TABLE = None
+_CRC32_SLICE = None
 
-def crc32(data, initial=0):
-    """Calculate CRC32 checksum"""
-    global _CRC32_TABLE
-    if _CRC32_TABLE is None:
-        _CRC32_TABLE = _crc32_table()
+def _crc32_python(data, initial=0):
+    """
+    Calculate CRC32 checksum (slice-by-4, pure Python)
     
+    Four bytes are folded into the CRC per iteration using four lookup
+    tables (4KB); the remaining 0-3 bytes use the byte table.
+    """
+    global _CRC32_TABLE, _CRC32_SLICE
+    if _CRC32_SLICE is None:
+        if _CRC32_TABLE is None:
+            _CRC32_TABLE = _crc32_table()
+        _CRC32_SLICE = _crc32_slice_tables(_CRC32_TABLE)
+    
+    # Tables in locals: the loop then does fast local loads instead of
+    # module-global dict lookups
+    t0 = _CRC32_TABLE
+    t1, t2, t3 = _CRC32_SLICE
     crc = initial ^ 0xFFFFFFFF
-    for byte in data:
-        crc = _CRC32_TABLE[(crc ^ byte) & 0xFF] ^ (crc >> 8)
+    n = len(data)
+    bulk = n & ~3
+    i = 0
+    while i < bulk:
+        crc ^= data[i] | (data[i + 1] << 8) | (data[i + 2] << 16) | (data[i + 3] << 24)
+        crc = (t3[crc & 0xFF] ^ t2[(crc >> 8) & 0xFF] ^
+               t1[(crc >> 16) & 0xFF] ^ t0[crc >> 24])
+        i += 4
+    while i < n:
+        crc = t0[(crc ^ data[i]) & 0xFF] ^ (crc >> 8)
+        i += 1
     return crc ^ 0xFFFFFFFF
 
+# Prefer the native binascii.crc32 (same polynomial and chaining), falling
+# back to the Python slice-by-4 loop on builds without it
+try:
+    from binascii import crc32 as _binascii_crc32
+    
+    def crc32(data, initial=0):
+        """Calculate CRC32 checksum"""
+        return _binascii_crc32(data, initial) & 0xFFFFFFFF
+except ImportError:
+    _CRC32_TABLE = _crc32_table()
+    _CRC32_SLICE = _crc32_slice_tables(_CRC32_TABLE)
+    crc32 = _crc32_python
+
 def generate_uuid():
     """Generate a simple UUID-like identifier"""
     ts = int(time.monotonic() * 1000000)
@@ -143,7 +203,8 @@ class HardwareConfigBlock:
     """
     
     def __init__(self):
-        self.items = []  # List of (hw_type, conn_type, identifier) tuples
+        self.items = []  # List of (hw_type, conn_type, identifier bytes) tuples
+        self._packed_items = []  # Serialized form of each item, built in add_hardware
     
     def add_hardware(self, hw_type, conn_type, identifier):
         """
@@ -157,36 +218,23 @@ class HardwareConfigBlock:
         if len(self.items) >= MAX_HARDWARE_ITEMS:
             return False
         
-        # Truncate identifier to 31 chars max
-        identifier = identifier[:31]
-        self.items.append((hw_type, conn_type, identifier))
+        # Truncate identifier to 31 chars max and encode once, here,
+        # rather than on every serialization
+        id_bytes = identifier[:31].encode('utf-8')
+        self.items.append((hw_type, conn_type, id_bytes))
+        
+        # Item record: type (1) + conn_type (1) + id_len (1) + identifier (N)
+        self._packed_items.append(bytes((hw_type, conn_type, len(id_bytes))) + id_bytes)
         return True
     
     def to_bytes(self):
         """Serialize to bytes"""
-        block = bytearray()
-        
-        # Magic + Block Type
-        block.extend(MAGIC)
-        block.append(BLOCK_TYPE_HARDWARE_CONFIG)
-        
-        # Number of hardware items
-        block.append(len(self.items))
-        
-        # Each hardware item: type (1) + conn_type (1) + id_len (1) + identifier (N)
-        for hw_type, conn_type, identifier in self.items:
-            block.append(hw_type)
-            block.append(conn_type)
-            
-            id_bytes = identifier.encode('utf-8')
-            block.append(len(id_bytes))
-            block.extend(id_bytes)
+        # Magic + Block Type + number of items, then the pre-packed items
+        block = (MAGIC + bytes((BLOCK_TYPE_HARDWARE_CONFIG, len(self.items))) +
+                 b''.join(self._packed_items))
         
         # CRC of entire block
-        block_crc = crc32(bytes(block))
-        block.extend(struct.pack('<I', block_crc))
-        
-        return bytes(block)
+        return block + struct.pack('<I', crc32(block))
     
     @staticmethod
     def from_hardware_setup():
@@ -311,53 +359,38 @@ class SessionHeader:
         self.weather = weather
         self.ambient_temp = int(ambient_temp * 10)  # 0.1°C resolution
         self.config_crc = config_crc
+        
+        # Strings are fixed for the session: encode them (and size the
+        # header format) once here rather than on every serialization
+        self._name_bytes = self.session_name.encode('utf-8')[:MAX_SESSION_NAME]
+        self._driver_bytes = self.driver_name.encode('utf-8')[:MAX_DRIVER_NAME]
+        self._vehicle_bytes = self.vehicle_id.encode('utf-8')[:MAX_VEHICLE_ID]
+        self._header_fmt = SESSION_HEADER_FMT % (
+            len(self._name_bytes), len(self._driver_bytes), len(self._vehicle_bytes))
     
     def to_bytes(self):
         """Serialize to bytes"""
-        # Build header
-        header = bytearray()
-        
-        # Magic + Block Type
-        header.extend(MAGIC)
-        header.append(BLOCK_TYPE_SESSION_HEADER)
-        
-        # Version info
-        header.append(FORMAT_VERSION_MAJOR)
-        header.append(FORMAT_VERSION_MINOR)
-        header.append(HARDWARE_VERSION_MAJOR)
-        header.append(HARDWARE_VERSION_MINOR)
-        
-        # Timestamp and Session ID
-        header.extend(struct.pack('<Q', self.timestamp_us))
-        header.extend(self.session_id)
-        
-        # Session name
-        name_bytes = self.session_name.encode('utf-8')[:MAX_SESSION_NAME]
-        header.append(len(name_bytes))
-        header.extend(name_bytes)
-        
-        # Driver name
-        driver_bytes = self.driver_name.encode('utf-8')[:MAX_DRIVER_NAME]
-        header.append(len(driver_bytes))
-        header.extend(driver_bytes)
-        
-        # Vehicle ID
-        vehicle_bytes = self.vehicle_id.encode('utf-8')[:MAX_VEHICLE_ID]
-        header.append(len(vehicle_bytes))
-        header.extend(vehicle_bytes)
-        
-        # Weather and temperature
-        header.append(self.weather)
-        header.extend(struct.pack('<h', self.ambient_temp))
-        
-        # Config CRC
-        header.extend(struct.pack('<I', self.config_crc))
+        name_bytes = self._name_bytes
+        driver_bytes = self._driver_bytes
+        vehicle_bytes = self._vehicle_bytes
+        
+        # Build header in one pack: magic, block type, format/hardware
+        # versions, timestamp, session ID, length-prefixed session name,
+        # driver name and vehicle ID, weather, temperature, config CRC
+        header = struct.pack(
+            self._header_fmt,
+            MAGIC, BLOCK_TYPE_SESSION_HEADER,
+            FORMAT_VERSION_MAJOR, FORMAT_VERSION_MINOR,
+            HARDWARE_VERSION_MAJOR, HARDWARE_VERSION_MINOR,
+            self.timestamp_us, self.session_id,
+            len(name_bytes), name_bytes,
+            len(driver_bytes), driver_bytes,
+            len(vehicle_bytes), vehicle_bytes,
+            self.weather, self.ambient_temp, self.config_crc
+        )
         
         # Calculate and append header CRC
-        header_crc = crc32(bytes(header))
-        header.extend(struct.pack('<I', header_crc))
-        
-        return bytes(header)
+        return header + struct.pack('<I', crc32(header))
 
 
 # =============================================================================
@@ -365,15 +398,26 @@ class SessionHeader:
 # =============================================================================
 
 class DataBlock:
-    """Data block with samples"""
+    """
+    Data block with samples
+    
+    Samples are packed straight into a preallocated payload buffer, and
+    the block is reset() and reused for the next block of the session.
+    """
     
     def __init__(self, session_id, block_seq):
         self.session_id = session_id
+        self._payload = bytearray(MAX_DATA_PAYLOAD)
+        self._payload_mv = memoryview(self._payload)
+        self.reset(block_seq)
+    
+    def reset(self, block_seq):
+        """Empty the block for reuse as block number block_seq"""
         self.block_sequence = block_seq
         self.timestamp_start = None
         self.timestamp_end = None
         self.flush_flags = 0
-        self.samples = []
+        self.sample_count = 0
         self.data_size = 0
     
     def add_sample(self, sample_type, timestamp_us, data):
@@ -382,40 +426,50 @@ class DataBlock:
             self.timestamp_start = timestamp_us
         self.timestamp_end = timestamp_us
         
-        # Calculate timestamp offset in ms
-        offset_ms = int((timestamp_us - self.timestamp_start) / 1000)
+        # Calculate timestamp offset in ms (integer division, no float)
+        offset_ms = (timestamp_us - self.timestamp_start) // 1000
         if offset_ms > 65535:
             offset_ms = 65535
         
-        # Build sample: type (1) + offset (2) + length (1) + data (N)
-        sample = struct.pack('<BHB', sample_type, offset_ms, len(data)) + data
-        
-        # Check if adding this sample would exceed max size
-        if self.data_size + len(sample) > MAX_DATA_PAYLOAD:
+        # Check if adding this sample would exceed max size before packing
+        data_len = len(data)
+        sample_size = SAMPLE_HEADER_SIZE + data_len
+        if self.data_size + sample_size > MAX_DATA_PAYLOAD:
             return False  # Block full
         
-        self.samples.append(sample)
-        self.data_size += len(sample)
+        # Build sample in place: type (1) + offset (2) + length (1) + data (N)
+        pos = self.data_size
+        struct.pack_into('<BHB', self._payload, pos, sample_type, offset_ms, data_len)
+        self._payload[pos + SAMPLE_HEADER_SIZE:pos + sample_size] = data
+        self.sample_count += 1
+        self.data_size = pos + sample_size
         return True
     
     def is_empty(self):
         """Check if block has no samples"""
-        return len(self.samples) == 0
+        return self.sample_count == 0
     
-    def should_flush(self, current_time, last_flush_time, gforce_total=0):
-        """Determine if block should be flushed"""
+    def should_flush(self, current_time, last_flush_time, gforce_sq=0,
+                     gforce_threshold_sq=FLUSH_GFORCE_THRESHOLD_SQ):
+        """
+        Determine if block should be flushed
+        
+        gforce_sq is the squared total g-force (gx² + gy² + gz²), compared
+        against the squared threshold so no square root is needed. A
+        threshold of 0 disables event flushes.
+        """
+        # Cheapest check first: size threshold (90% full, integer compare)
+        if self.data_size >= FLUSH_SIZE_THRESHOLD:
+            self.flush_flags |= FLUSH_FLAG_SIZE
+            return True
+        
         # Time threshold
         if current_time - last_flush_time >= FLUSH_TIME_THRESHOLD:
             self.flush_flags |= FLUSH_FLAG_TIME
             return True
         
-        # Size threshold (90% full)
-        if self.data_size >= int(MAX_DATA_PAYLOAD * 0.9):
-            self.flush_flags |= FLUSH_FLAG_SIZE
-            return True
-        
         # G-force event threshold
-        if gforce_total >= FLUSH_GFORCE_THRESHOLD:
+        if gforce_threshold_sq and gforce_sq >= gforce_threshold_sq:
             self.flush_flags |= FLUSH_FLAG_EVENT
             return True
         
@@ -426,35 +480,25 @@ class DataBlock:
         if self.is_empty():
             return b''
         
-        # Build block header
-        header = bytearray()
-        
-        # Magic + Block Type
-        header.extend(MAGIC)
-        header.append(BLOCK_TYPE_DATA)
-        
-        # Session ID and block sequence
-        header.extend(self.session_id)
-        header.extend(struct.pack('<I', self.block_sequence))
-        
-        # Timestamps
-        header.extend(struct.pack('<Q', self.timestamp_start or 0))
-        header.extend(struct.pack('<Q', self.timestamp_end or 0))
-        
-        # Flush flags, sample count, data size
-        header.append(self.flush_flags)
-        header.extend(struct.pack('<H', len(self.samples)))
-        header.extend(struct.pack('<H', self.data_size))
+        # Build block header in one pack: magic, block type, session ID,
+        # block sequence, timestamps, flush flags, sample count, data size
+        header = struct.pack(
+            DATA_BLOCK_HEADER_FMT,
+            MAGIC, BLOCK_TYPE_DATA, self.session_id, self.block_sequence,
+            self.timestamp_start or 0, self.timestamp_end or 0,
+            self.flush_flags, self.sample_count, self.data_size
+        )
         
-        # Combine all samples
-        data_payload = b''.join(self.samples)
+        # Header + packed samples (copied out, so the buffer can be reused)
+        block_data = bytearray(header)
+        block_data.extend(self._payload_mv[:self.data_size])
         
         # Calculate CRC32 checksum of header + data
-        block_data = bytes(header) + data_payload
         checksum = crc32(block_data)
         
         # Return block with CRC32 (4 bytes, little-endian)
-        return block_data + struct.pack('<I', checksum)
+        block_data.extend(struct.pack('<I', checksum))
+        return block_data
 
 
 # =============================================================================
@@ -464,10 +508,21 @@ class DataBlock:
 class BinaryLogger:
     """Binary logging with session management"""
     
-    def __init__(self, base_path="/sd"):
+    def __init__(self, base_path="/sd", gforce_threshold=FLUSH_GFORCE_THRESHOLD):
+        """
+        Args:
+            base_path: Directory for session files
+            gforce_threshold: Total g that forces a block flush (0 disables)
+        """
         self.base_path = base_path
+        # Squared so the per-sample check needs no sqrt; 0 means disabled
+        if gforce_threshold and gforce_threshold > 0:
+            self._gforce_threshold_sq = gforce_threshold * gforce_threshold
+        else:
+            self._gforce_threshold_sq = 0
         self.log_file = None
         self.log_filename = None
+        self._pending_header = None
         self.current_session = None
         self.current_block = None
         self.block_sequence = 0
@@ -515,16 +570,17 @@ class BinaryLogger:
             print(f"[BinaryLog Debug]   Generated timestamp filename: {self.log_filename}")
         
         self.bytes_written = 0
-        # Open log file and write session header
-        self.log_file = open(self.log_filename, 'wb')
-        self.log_file.write(self.current_session.to_bytes())
-        self.log_file.flush()
+        # Session header (and hardware config) are written when the file is
+        # opened on the first block flush, so a session that never logs
+        # anything doesn't touch the SD card
+        self.log_file = None
+        self._pending_header = self.current_session.to_bytes()
 
         # Store hardware config
         if include_hardware:
             hw_block = HardwareConfigBlock.from_hardware_setup()
             if hw_block:
-                self.log_file.write(hw_block.to_bytes())
+                self._pending_header += hw_block.to_bytes()
                 print(f"[BinaryLog] Hardware config: {len(hw_block.items)} items")
         
         # Initialize first data block
@@ -540,58 +596,86 @@ class BinaryLogger:
         print(f"[BinaryLog] Session started: {self.log_filename}")
         return self.current_session.session_id
     
-    def write_sample(self, sample_type, data, timestamp_us=None, gforce_total=0):
-        """Write a sample to the current block"""
+    def write_sample(self, sample_type, data, timestamp_us=None, gforce_sq=0):
+        """Write a sample to the current block (gforce_sq: squared total g)"""
         if not self.active:
             return False
         
+        # One clock read per sample, shared by the timestamp and flush checks
+        current_time = time.monotonic()
         if timestamp_us is None:
-            timestamp_us = int(time.monotonic() * 1000000)
+            timestamp_us = int(current_time * 1000000)
         
         # Try to add sample to current block
         if not self.current_block.add_sample(sample_type, timestamp_us, data):
             # Block full, flush and create new block
-            self._flush_block()
+            self._flush_block(now=current_time)
             self.current_block.add_sample(sample_type, timestamp_us, data)
         
         # Check if we should flush
-        current_time = time.monotonic()
-        if self.current_block.should_flush(current_time, self._last_flush_time, gforce_total):
-            self._flush_block()
+        if self.current_block.should_flush(current_time, self._last_flush_time,
+                                           gforce_sq, self._gforce_threshold_sq):
+            self._flush_block(now=current_time)
         
         return True
     
-    def _flush_block(self):
-        """Flush current block to file"""
+    def _open_log(self):
+        """Open the log file (the session header goes out with the first block)"""
+        try:
+            self.log_file = open(self.log_filename, 'wb')
+        except OSError as e:
+            print(f"[BinaryLog] Error opening {self.log_filename}: {e}")
+            self.log_file = None
+            self.active = False
+            return False
+        return True
+    
+    def _flush_block(self, trailer=b'', now=None):
+        """
+        Flush current block to file
+        
+        Any pending session header and the optional trailer bytes are
+        written in the same write() call as the block. now is the caller's
+        time.monotonic() reading, if it already has one.
+        """
         if self.current_block and not self.current_block.is_empty():
+            if self.log_file is None and not self._open_log():
+                return
             block_bytes = self.current_block.to_bytes()
-            self.log_file.write(block_bytes)
-            self.log_file.flush()
             self.bytes_written += len(block_bytes)
+            if self._pending_header:
+                block_bytes = self._pending_header + block_bytes
+                self._pending_header = None
+            self.log_file.write(block_bytes + trailer if trailer else block_bytes)
+            self.log_file.flush()
             
-            # Create new block
+            # Start the next block in the same buffer
             self.block_sequence += 1
-            self.current_block = DataBlock(
-                self.current_session.session_id,
-                self.block_sequence
-            )
-            self._last_flush_time = time.monotonic()
+            self.current_block.reset(self.block_sequence)
+            self._last_flush_time = now if now is not None else time.monotonic()
+        elif trailer and self.log_file is not None:
+            self.log_file.write(trailer)
+            self.log_file.flush()
     
     def stop_session(self):
         """Stop current logging session"""
         if not self.active:
             return
         
-        # Flush remaining data
-        self._flush_block()
-        
-        # Write session end marker
+        # Flush remaining data together with the session end marker
         end_block = MAGIC + bytes([BLOCK_TYPE_SESSION_END]) + self.current_session.session_id
-        self.log_file.write(end_block)
-        self.log_file.flush()
-        self.log_file.close()
+        self._flush_block(end_block)
         
         self.active = False
+        if self.log_file is None:
+            # Nothing was logged, so the file was never created
+            self._pending_header = None
+            print(f"[BinaryLog] Session stopped (no data): {self.log_filename}")
+            return
+        
+        self.log_file.close()
+        self.log_file = None
+        
         print(f"[BinaryLog] Session stopped: {self.log_filename}")
     
     # Convenience methods
@@ -620,8 +704,8 @@ class BinaryLogger:
     def write_accelerometer(self, gx, gy, gz, timestamp_us=None):
         """Write accelerometer data"""
         data = struct.pack('<fff', gx, gy, gz)
-        g_total = (gx**2 + gy**2 + gz**2)**0.5
-        return self.write_sample(SAMPLE_TYPE_ACCELEROMETER, data, timestamp_us, g_total)
+        g_sq = gx * gx + gy * gy + gz * gz if self._gforce_threshold_sq else 0
+        return self.write_sample(SAMPLE_TYPE_ACCELEROMETER, data, timestamp_us, g_sq)
 
     def write_gyroscope(self, gx, gy, gz, timestamp_us=None):
         """Write gyroscope data (degrees/sec)"""
@@ -651,7 +735,12 @@ class BinaryLogger:
         Total: 5 bytes per satellite
         """
         # Pack: count (1 byte) + for each sat: id (1), azimuth (2), elevation (1), snr (1)
-        data = struct.pack('<B', len(satellites))
+        # into one buffer sized up front (no bytes concatenation per satellite)
+        count = len(satellites)
+        data = bytearray(1 + 5 * count)
+        data[0] = count
+        pack_into = struct.pack_into
+        offset = 1
         for sat in satellites:
             # Clamp values to valid ranges
             sat_id = min(255, max(0, sat['id']))
@@ -660,7 +749,8 @@ class BinaryLogger:
             snr = min(99, max(0, sat['snr']))
             
             # Pack: id (B), azimuth (H=2 bytes), elevation (B), snr (B)
-            data += struct.pack('<BHBB', sat_id, azimuth, elevation, snr)
+            pack_into('<BHBB', data, offset, sat_id, azimuth, elevation, snr)
+            offset += 5
         
         return self.write_sample(SAMPLE_TYPE_GPS_SATELLITES, data, timestamp_us)
 
@@ -179,6 +179,25 @@ gps_has_fix = False
 # empty last value
 data = { 'gps': {}, 'gyro': {}, 'accel': {}, 'mag': {} }
 
+# Section dicts bound once; the loop fills them in place so the display,
+# NeoPixel and telemetry consumers still see the same `data` structure
+accel_data = data['accel']
+gyro_data = data['gyro']
+mag_data = data['mag']
+gps_data = data['gps']
+
+# GPS values reported while there is no fix (applied in place, no new dict per loop)
+GPS_NO_FIX = {
+    'fix':      "NoFix",
+    'lat':      0.0,
+    'lon':      0.0,
+    'alt':      0.0,
+    'speed':    0.0,
+    'heading':  0.0,
+    'hdop':    25.9,
+    'sats':     0,
+}
+
 # 
 # TODO - this needs to come from the config
 print("\n" + "="*60)
@@ -198,51 +217,44 @@ print("="*60 + "\n")
 try:
     while True:
         current_time = time.monotonic()
+        # One log timestamp per tick; the loggers otherwise read the clock per sample
+        tick_us = int(current_time * 1000000)
         
         # 100Hz: Read sensors and log
         if accel:
-            data['accel']['ax'], data['accel']['ay'], data['accel']['az'], data['accel']['ts'] = accel.read()
-            data['accel']['gx'], data['accel']['gy'], data['accel']['gz'] = accel.get_g_forces()
-            data['accel']['total'] = data['accel']['gx'] + data['accel']['gy']
-            logger.write_accelerometer(data['accel']['gx'], data['accel']['gy'], data['accel']['gz'])
+            accel_data['ax'], accel_data['ay'], accel_data['az'], accel_data['ts'] = accel.read()
+            accel_data['gx'], accel_data['gy'], accel_data['gz'] = accel.get_g_forces()
+            accel_data['total'] = accel_data['gx'] + accel_data['gy']
+            logger.write_accelerometer(accel_data['gx'], accel_data['gy'], accel_data['gz'], tick_us)
         
         if gyro:
-            data['gyro']['gx'], data['gyro']['gy'], data['gyro']['gz'] = gyro.read()
-            data['gyro']['ang_vel'] = gyro.get_angular_velocity()
-            logger.write_gyroscope(data['gyro']['gx'], data['gyro']['gy'], data['gyro']['gz'])
+            gyro_data['gx'], gyro_data['gy'], gyro_data['gz'] = gyro.read()
+            gyro_data['ang_vel'] = gyro.get_angular_velocity()
+            logger.write_gyroscope(gyro_data['gx'], gyro_data['gy'], gyro_data['gz'], tick_us)
         
         if mag:
-            data['mag']['mx'], data['mag']['my'], data['mag']['mz'] = mag.read()
-            data['mag']['heading'] = mag.get_heading()
-            data['mag']['field'] = mag.get_field_strength()
-            logger.write_magnetometer(data['mag']['mx'], data['mag']['my'], data['mag']['mz'])
+            mag_data['mx'], mag_data['my'], mag_data['mz'] = mag.read()
+            mag_data['heading'] = mag.get_heading()
+            mag_data['field'] = mag.get_field_strength()
+            logger.write_magnetometer(mag_data['mx'], mag_data['my'], mag_data['mz'], tick_us)
         
         # Update GPS
         if gps_handler:
             gps_handler.update()
             if gps_handler.has_fix():
                 gps_has_fix = True
-                data['gps']['fix'] = gps_handler.fix_type()
-                data['gps']['lat'], data['gps']['lon'], data['gps']['alt'] = gps_handler.get_position()
-                data['gps']['speed'] = gps_handler.get_speed()
-                data['gps']['heading'] = gps_handler.get_heading()
-                data['gps']['hdop'] = gps_handler.get_hdop()
-                data['gps']['sats'] = gps_handler.get_satellites()
-                logger.write_gps(data['gps']['lat'], data['gps']['lon'], data['gps']['alt'], 
-                    data['gps']['speed'], data['gps']['heading'], data['gps']['hdop'])
+                gps_data['fix'] = gps_handler.fix_type()
+                gps_data['lat'], gps_data['lon'], gps_data['alt'] = gps_handler.get_position()
+                gps_data['speed'] = gps_handler.get_speed()
+                gps_data['heading'] = gps_handler.get_heading()
+                gps_data['hdop'] = gps_handler.get_hdop()
+                gps_data['sats'] = gps_handler.get_satellites()
+                logger.write_gps(gps_data['lat'], gps_data['lon'], gps_data['alt'], 
+                    gps_data['speed'], gps_data['heading'], gps_data['hdop'], tick_us)
             else:
                 gps_has_fix = False
-                data['gps'] = {
-                    'fix':      "NoFix",
-                    'lat':      0.0,
-                    'lon':      0.0,
-                    'alt':      0.0,
-                    'speed':    0.0,
-                    'heading':  0.0,
-                    'hdop':    25.9,
-                    'stats':    0,
-                }
-            data['gps']['has_fix'] = gps_has_fix
+                gps_data.update(GPS_NO_FIX)
+            gps_data['has_fix'] = gps_has_fix
         
         # 1Hz: Telemetry
         if current_time - last_telemetry >= 1.0:
@@ -253,21 +265,21 @@ try:
             
             if accel:
                 print("Accel: {:+.2f}g {:+.2f}g {:+.2f}g | ".format(
-                    data['accel']['gx'], data['accel']['gy'], data['accel']['gz']), end="")
+                    accel_data['gx'], accel_data['gy'], accel_data['gz']), end="")
             
             if gyro:
                 print("Gyro: {:+.1f}°/s {:+.1f}°/s {:+.1f}°/s | ".format(
-                    data['gyro']['gx'], data['gyro']['gy'], data['gyro']['gz']), end="")
+                    gyro_data['gx'], gyro_data['gy'], gyro_data['gz']), end="")
             
             if mag:
                 heading = mag.get_heading()
                 field = mag.get_field_strength()
                 print("Mag: {:.0f}° {:.1f}µT | ".format(
-                    data['mag']['heading'],data['mag']['field']) , end="")
+                    mag_data['heading'],mag_data['field']) , end="")
             
             if gps_handler and gps_has_fix:
                 print("GPS: {} sats @{}".format(
-                    data['gps']['sats'], data['gps']['hdop']))
+                    gps_data['sats'], gps_data['hdop']))
             else:
                 print("GPS: No fix")
             
@@ -87,7 +87,7 @@ class Gyroscope:
             else:
                 return "No data"
         
-        return f"X:{gx:+6.1f}°/s Y:{gy:+6.1f}°/s Z:{gz:+6.1f}°/s"
+        return "X:%+6.1f°/s Y:%+6.1f°/s Z:%+6.1f°/s" % (gx, gy, gz)
     
     def get_angular_velocity(self):
         """
@@ -22,6 +22,13 @@ import time
 import struct
 from micropython import const
 
+# ulab (numpy subset) is optional; used to average calibration samples
+try:
+    from ulab import numpy as np
+    HAS_ULAB = True
+except ImportError:
+    HAS_ULAB = False
+
 # I2C addresses
 LSM6DSOX_ADDR_LOW = const(0x6A)   # SDO/SA0 = GND
 LSM6DSOX_ADDR_HIGH = const(0x6B)  # SDO/SA0 = VCC
@@ -79,6 +86,11 @@ GYRO_SCALE_500 = 65.5
 GYRO_SCALE_1000 = 32.8
 GYRO_SCALE_2000 = 16.4
 
+# Output register layouts (signed 16-bit, little-endian)
+_FMT_XYZ = '<hhh'           # one sensor, X/Y/Z
+_FMT_GYRO_ACCEL = '<hhhhhh' # gyro X/Y/Z then accel X/Y/Z
+_FMT_TEMP = '<h'
+
 
 class LSM6DSOX:
     """
@@ -119,6 +131,13 @@ class LSM6DSOX:
         self.address = address
         self.mode = mode.lower()
         
+        # Reusable receive buffer for output register reads (no allocation
+        # per sample); 12 bytes covers the gyro+accel burst
+        self._rx = bytearray(12)
+        rx_mv = memoryview(self._rx)
+        self._rx6 = rx_mv[:6]
+        self._rx2 = rx_mv[:2]
+        
         if self.mode not in ('accel', 'gyro', 'both'):
             raise ValueError("mode must be 'accel', 'gyro', or 'both'")
         
@@ -173,6 +192,10 @@ class LSM6DSOX:
         """Read multiple bytes from register"""
         return self.i2c.readfrom_mem(self.address, reg, length)
     
+    def _read_into(self, reg, buf):
+        """Read len(buf) bytes from register into buf"""
+        self.i2c.readfrom_mem_into(self.address, reg, buf)
+    
     def _set_accel_scale(self):
         """Set accelerometer scale factor"""
         scales = {
@@ -182,6 +205,8 @@ class LSM6DSOX:
             ACCEL_RANGE_16G: ACCEL_SCALE_16G
         }
         self.accel_scale = scales.get(self.accel_range, ACCEL_SCALE_2G)
+        # Combined LSB -> m/s² multiplier (one multiply per axis per read)
+        self._accel_mul = 9.80665 / self.accel_scale
     
     def _set_gyro_scale(self):
         """Set gyroscope scale factor"""
@@ -193,6 +218,8 @@ class LSM6DSOX:
             GYRO_RANGE_2000: GYRO_SCALE_2000
         }
         self.gyro_scale = scales.get(self.gyro_range, GYRO_SCALE_250)
+        # LSB -> dps multiplier
+        self._gyro_mul = 1.0 / self.gyro_scale
     
     def _get_accel_range_g(self):
         """Get accelerometer range in g"""
@@ -227,17 +254,14 @@ class LSM6DSOX:
             raise RuntimeError(f"Accelerometer not enabled (mode='{self.mode}')")
         
         # Read 6 bytes
-        data = self._read_bytes(OUTX_L_A, 6)
+        self._read_into(OUTX_L_A, self._rx6)
         
         # Unpack as signed 16-bit values (little-endian)
-        raw_x, raw_y, raw_z = struct.unpack('<hhh', data)
+        raw_x, raw_y, raw_z = struct.unpack_from(_FMT_XYZ, self._rx)
         
         # Convert to m/s²
-        x = (raw_x / self.accel_scale) * 9.80665
-        y = (raw_y / self.accel_scale) * 9.80665
-        z = (raw_z / self.accel_scale) * 9.80665
-        
-        return (x, y, z)
+        mul = self._accel_mul
+        return (raw_x * mul, raw_y * mul, raw_z * mul)
     
     @property
     def gyro(self):
@@ -251,17 +275,14 @@ class LSM6DSOX:
             raise RuntimeError(f"Gyroscope not enabled (mode='{self.mode}')")
         
         # Read 6 bytes
-        data = self._read_bytes(OUTX_L_G, 6)
+        self._read_into(OUTX_L_G, self._rx6)
         
         # Unpack as signed 16-bit values (little-endian)
-        raw_x, raw_y, raw_z = struct.unpack('<hhh', data)
+        raw_x, raw_y, raw_z = struct.unpack_from(_FMT_XYZ, self._rx)
         
         # Convert to dps
-        gx = raw_x / self.gyro_scale
-        gy = raw_y / self.gyro_scale
-        gz = raw_z / self.gyro_scale
-        
-        return (gx, gy, gz)
+        mul = self._gyro_mul
+        return (raw_x * mul, raw_y * mul, raw_z * mul)
     
     @property
     def temperature(self):
@@ -272,14 +293,39 @@ class LSM6DSOX:
             Temperature in Celsius
         """
         # Read 2 bytes
-        data = self._read_bytes(OUT_TEMP_L, 2)
-        raw_temp = struct.unpack('<h', data)[0]
+        self._read_into(OUT_TEMP_L, self._rx2)
+        raw_temp = struct.unpack_from(_FMT_TEMP, self._rx)[0]
         
         # Convert to Celsius: 25°C + (value / 256)
         temp_c = 25.0 + (raw_temp / 256.0)
         
         return temp_c
     
+    def read_accel_gyro(self):
+        """
+        Read gyroscope and accelerometer in one 12-byte burst
+        
+        The gyro (0x22-0x27) and accel (0x28-0x2D) output registers are
+        contiguous, so one I2C transaction covers both; with BDU enabled
+        the pair comes from the same sample.
+        
+        Returns:
+            Tuple of ((x, y, z) in m/s², (gx, gy, gz) in degrees/second)
+        """
+        if self.mode != 'both':
+            raise RuntimeError(f"Accelerometer and gyroscope not both enabled (mode='{self.mode}')")
+        
+        # Read 12 bytes starting at the gyro X low byte
+        self._read_into(OUTX_L_G, self._rx)
+        
+        # Unpack as signed 16-bit values (little-endian): gyro XYZ, accel XYZ
+        raw_gx, raw_gy, raw_gz, raw_x, raw_y, raw_z = struct.unpack_from(_FMT_GYRO_ACCEL, self._rx)
+        
+        amul = self._accel_mul
+        gmul = self._gyro_mul
+        return ((raw_x * amul, raw_y * amul, raw_z * amul),
+                (raw_gx * gmul, raw_gy * gmul, raw_gz * gmul))
+    
     def read_all(self):
         """
         Read all sensors at once
@@ -289,10 +335,11 @@ class LSM6DSOX:
         """
         result = {}
         
-        if self.mode in ('accel', 'both'):
+        if self.mode == 'both':
+            result['accel'], result['gyro'] = self.read_accel_gyro()
+        elif self.mode == 'accel':
             result['accel'] = self.acceleration
-        
-        if self.mode in ('gyro', 'both'):
+        else:
             result['gyro'] = self.gyro
         
         result['temp'] = self.temperature
@@ -315,18 +362,31 @@ class LSM6DSOX:
         print(f"[LSM6DSOX] Calibrating gyro ({samples} samples)...")
         print("[LSM6DSOX] Keep sensor stationary!")
         
-        sum_x = sum_y = sum_z = 0
-        
-        for i in range(samples):
-            gx, gy, gz = self.gyro
-            sum_x += gx
-            sum_y += gy
-            sum_z += gz
-            time.sleep(0.01)
-        
-        offset_x = sum_x / samples
-        offset_y = sum_y / samples
-        offset_z = sum_z / samples
+        # Collect raw counts (one 6-byte burst each) and scale once at the end
+        if HAS_ULAB:
+            raw = np.zeros((samples, 3), dtype=np.int16)
+            for i in range(samples):
+                self._read_into(OUTX_L_G, self._rx6)
+                raw[i, 0], raw[i, 1], raw[i, 2] = struct.unpack_from(_FMT_XYZ, self._rx)
+                time.sleep(0.01)
+            mean_x, mean_y, mean_z = np.mean(raw, axis=0)
+        else:
+            sum_x = sum_y = sum_z = 0
+            for i in range(samples):
+                self._read_into(OUTX_L_G, self._rx6)
+                raw_x, raw_y, raw_z = struct.unpack_from(_FMT_XYZ, self._rx)
+                sum_x += raw_x
+                sum_y += raw_y
+                sum_z += raw_z
+                time.sleep(0.01)
+            mean_x = sum_x / samples
+            mean_y = sum_y / samples
+            mean_z = sum_z / samples
+        
+        mul = self._gyro_mul
+        offset_x = mean_x * mul
+        offset_y = mean_y * mul
+        offset_z = mean_z * mul
         
         print(f"[LSM6DSOX] Gyro offsets: X={offset_x:.2f}, Y={offset_y:.2f}, Z={offset_z:.2f} °/s")
         
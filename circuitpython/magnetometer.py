@@ -9,6 +9,26 @@ Handles magnetometer data from various sensors:
 import time
 import math
 
+RAD_TO_DEG = 180.0 / math.pi
+
+
+def _fast_atan2(y, x):
+    """
+    atan2 approximation (max error ~0.01 rad / ~0.6°)
+    
+    Plenty for a displayed compass heading and cheaper than math.atan2.
+    """
+    if x == 0 and y == 0:
+        return 0.0  # Match math.atan2(0, 0) for a zero field vector
+    abs_y = abs(y) + 1e-10  # Avoid 0/0 at the origin
+    if x >= 0:
+        r = (x - abs_y) / (x + abs_y)
+        a = 0.1963 * r * r * r - 0.9817 * r + 0.7854
+    else:
+        r = (x + abs_y) / (abs_y - x)
+        a = 0.1963 * r * r * r - 0.9817 * r + 2.3562
+    return -a if y < 0 else a
+
 
 class Magnetometer:
     """Magnetometer data handler"""
@@ -28,11 +48,14 @@ class Magnetometer:
         self.offset_x = 0.0
         self.offset_y = 0.0
         self.offset_z = 0.0
+        self._offsets = (0.0, 0.0, 0.0)  # Same offsets as one tuple for read()
         
-        # Peak tracking
-        self.peak_x = 0.0
-        self.peak_y = 0.0
-        self.peak_z = 0.0
+        # Peak tracking (signed peaks plus their squares, so read()
+        # doesn't re-take abs() of the stored peak every sample)
+        self.reset_peaks()
+        
+        # Bound once; read() runs every loop tick
+        self._monotonic = time.monotonic
     
     def read(self):
         """
@@ -43,23 +66,33 @@ class Magnetometer:
         """
         try:
             mx, my, mz = self.sensor.magnetic
-            timestamp = time.monotonic()
+            timestamp = self._monotonic()
             
             # Apply calibration offsets
-            mx -= self.offset_x
-            my -= self.offset_y
-            mz -= self.offset_z
+            ox, oy, oz = self._offsets
+            mx -= ox
+            my -= oy
+            mz -= oz
             
             self.last_reading = (mx, my, mz)
             self.last_timestamp = timestamp
             
-            # Update peaks
-            if abs(mx) > abs(self.peak_x):
-                self.peak_x = mx
-            if abs(my) > abs(self.peak_y):
-                self.peak_y = my
-            if abs(mz) > abs(self.peak_z):
-                self.peak_z = mz
+            # Update peaks. A new per-axis peak needs mx²+my²+mz² above the
+            # smallest squared peak, so one compare skips the common case.
+            sx = mx * mx
+            sy = my * my
+            sz = mz * mz
+            if sx + sy + sz > self._peak_min_sq:
+                if sx > self._peak_sq_x:
+                    self.peak_x = mx
+                    self._peak_sq_x = sx
+                if sy > self._peak_sq_y:
+                    self.peak_y = my
+                    self._peak_sq_y = sy
+                if sz > self._peak_sq_z:
+                    self.peak_z = mz
+                    self._peak_sq_z = sz
+                self._peak_min_sq = min(self._peak_sq_x, self._peak_sq_y, self._peak_sq_z)
             
             return mx, my, mz, timestamp
             
@@ -80,6 +113,10 @@ class Magnetometer:
         self.peak_x = 0.0
         self.peak_y = 0.0
         self.peak_z = 0.0
+        self._peak_sq_x = 0.0
+        self._peak_sq_y = 0.0
+        self._peak_sq_z = 0.0
+        self._peak_min_sq = 0.0
     
     def get_heading(self):
         """
@@ -98,7 +135,7 @@ class Magnetometer:
         mx, my, mz = self.last_reading
         
         # Calculate heading (atan2 gives -180 to +180)
-        heading = math.atan2(my, mx) * 180.0 / math.pi
+        heading = _fast_atan2(my, mx) * RAD_TO_DEG
         
         # Normalize to 0-360
         if heading < 0:
@@ -129,6 +166,7 @@ class Magnetometer:
         self.offset_x = offset_x
         self.offset_y = offset_y
         self.offset_z = offset_z
+        self._offsets = (offset_x, offset_y, offset_z)
         print(f"[Mag] Calibration set: X={offset_x:.1f} Y={offset_y:.1f} Z={offset_z:.1f}")
     
     def format_reading(self, mx=None, my=None, mz=None):
@@ -147,4 +185,4 @@ class Magnetometer:
             else:
                 return "No data"
         
-        return f"X:{mx:+6.1f}µT Y:{my:+6.1f}µT Z:{mz:+6.1f}µT"
+        return "X:%+6.1fµT Y:%+6.1fµT Z:%+6.1fµT" % (mx, my, mz)
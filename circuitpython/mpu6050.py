@@ -33,16 +33,20 @@ SMPLRT_DIV = const(0x19)      # Sample rate divider
 CONFIG = const(0x1A)          # Configuration
 GYRO_CONFIG = const(0x1B)     # Gyroscope configuration
 ACCEL_CONFIG = const(0x1C)    # Accelerometer configuration
+INT_PIN_CFG = const(0x37)     # INT pin configuration
 INT_ENABLE = const(0x38)      # Interrupt enable
 
 # Data registers
 ACCEL_XOUT_H = const(0x3B)    # Accelerometer X high byte
 TEMP_OUT_H = const(0x41)      # Temperature high byte
 GYRO_XOUT_H = const(0x43)     # Gyroscope X high byte
+WHO_AM_I = const(0x75)        # Device ID (0x68)
 
 # Configuration values
 PWR_MGMT_1_RESET = const(0x80)
 PWR_MGMT_1_SLEEP = const(0x40)
+INT_PIN_CFG_LATCH = const(0x30)  # Latch INT high until any data register read
+INT_DATA_RDY = const(0x01)       # Data-ready interrupt
 
 # Accelerometer ranges (±g)
 ACCEL_RANGE_2G = const(0x00)   # ±2g
@@ -67,6 +71,21 @@ GYRO_SCALE_500 = 65.5
 GYRO_SCALE_1000 = 32.8
 GYRO_SCALE_2000 = 16.4
 
+# Range register value -> (scale factor, full-scale range)
+_ACCEL_RANGES = {
+    ACCEL_RANGE_2G: (ACCEL_SCALE_2G, 2),
+    ACCEL_RANGE_4G: (ACCEL_SCALE_4G, 4),
+    ACCEL_RANGE_8G: (ACCEL_SCALE_8G, 8),
+    ACCEL_RANGE_16G: (ACCEL_SCALE_16G, 16)
+}
+
+_GYRO_RANGES = {
+    GYRO_RANGE_250: (GYRO_SCALE_250, 250),
+    GYRO_RANGE_500: (GYRO_SCALE_500, 500),
+    GYRO_RANGE_1000: (GYRO_SCALE_1000, 1000),
+    GYRO_RANGE_2000: (GYRO_SCALE_2000, 2000)
+}
+
 
 class MPU6050:
     """
@@ -89,21 +108,38 @@ class MPU6050:
     """
     
     def __init__(self, i2c, address=MPU6050_ADDR_LOW, mode='both',
-                 accel_range=ACCEL_RANGE_2G, gyro_range=GYRO_RANGE_250):
+                 accel_range=ACCEL_RANGE_2G, gyro_range=GYRO_RANGE_250,
+                 sample_rate=1000, int_pin=None):
         """
         Initialize MPU-6050
         
         Args:
-            i2c: I2C bus object
+            i2c: I2C bus object (400kHz fast mode recommended)
             address: I2C address (0x68 or 0x69)
             mode: Operating mode - 'accel', 'gyro', or 'both'
             accel_range: Accelerometer range (ACCEL_RANGE_2G/4G/8G/16G)
             gyro_range: Gyroscope range (GYRO_RANGE_250/500/1000/2000)
+            sample_rate: Output data rate in Hz (4-1000); match it to how
+                often the sensor is actually polled
+            int_pin: Optional board pin wired to the INT output. When set,
+                read_all() only touches the bus once a new sample is ready.
         """
         self.i2c = i2c
         self.address = address
         self.mode = mode.lower()
         
+        # Reusable receive buffer for data register reads (no allocation
+        # per sample); 14 bytes covers the accel+temp+gyro burst
+        self._rx = bytearray(14)
+        rx_mv = memoryview(self._rx)
+        self._rx8 = rx_mv[:8]
+        self._rx6 = rx_mv[:6]
+        self._rx2 = rx_mv[:2]
+        
+        # Bias offsets in raw counts, removed before scaling
+        self._accel_off = (0, 0, 0)
+        self._gyro_off = (0, 0, 0)
+        
         if self.mode not in ('accel', 'gyro', 'both'):
             raise ValueError("mode must be 'accel', 'gyro', or 'both'")
         
@@ -111,6 +147,12 @@ class MPU6050:
         if address not in i2c.scan():
             raise RuntimeError(f"MPU-6050 not found at address 0x{address:02X}")
         
+        # A 14-byte burst takes ~1.3ms at 100kHz vs ~0.33ms at 400kHz; the
+        # bus is configured by the caller, so only warn about slow buses
+        frequency = getattr(i2c, 'frequency', None)
+        if frequency and frequency < 400000:
+            print(f"[MPU6050] Warning: I2C at {frequency}Hz, 400000Hz recommended")
+        
         # Reset device
         self._write_byte(PWR_MGMT_1, PWR_MGMT_1_RESET)
         time.sleep(0.1)  # Wait for reset
@@ -131,20 +173,33 @@ class MPU6050:
             self.gyro_range = gyro_range
             self._set_gyro_scale()
         
-        # Set sample rate to 1kHz / (1 + SMPLRT_DIV)
+        # Set sample rate to 1kHz / (1 + SMPLRT_DIV) (1kHz base with DLPF on)
         # Default: 1kHz / (1 + 0) = 1kHz
-        self._write_byte(SMPLRT_DIV, 0)
+        smplrt_div = min(255, max(0, 1000 // max(1, sample_rate) - 1))
+        self._write_byte(SMPLRT_DIV, smplrt_div)
+        self.sample_rate = 1000 // (1 + smplrt_div)
         
         # Configure digital low pass filter (DLPF)
         # 0x06 = 5Hz bandwidth (good for reducing noise)
         self._write_byte(CONFIG, 0x06)
         
+        # Optional data-ready line. CircuitPython has no pin IRQs, so the pin
+        # is polled: a GPIO read is far cheaper than a 14-byte I2C burst.
+        self._int_pin = None
+        self._last_all = None
+        if int_pin is not None:
+            import digitalio
+            self._int_pin = digitalio.DigitalInOut(int_pin)
+            self._int_pin.direction = digitalio.Direction.INPUT
+            self._write_byte(INT_PIN_CFG, INT_PIN_CFG_LATCH)
+            self._write_byte(INT_ENABLE, INT_DATA_RDY)
+        
         print(f"[MPU6050] Initialized at 0x{address:02X}")
-        print(f"[MPU6050] Mode: {mode}")
+        print(f"[MPU6050] Mode: {mode}, {self.sample_rate}Hz")
         if self.mode in ('accel', 'both'):
-            print(f"[MPU6050] Accel range: ±{self._get_accel_range_g()}g")
+            print(f"[MPU6050] Accel range: ±{self.accel_range_g}g")
         if self.mode in ('gyro', 'both'):
-            print(f"[MPU6050] Gyro range: ±{self._get_gyro_range_dps()}°/s")
+            print(f"[MPU6050] Gyro range: ±{self.gyro_range_dps}°/s")
     
     def _write_byte(self, reg, value):
         """Write single byte to register"""
@@ -154,45 +209,23 @@ class MPU6050:
         """Read multiple bytes from register"""
         return self.i2c.readfrom_mem(self.address, reg, length)
     
+    def _read_into(self, reg, buf):
+        """Read len(buf) bytes from register into buf"""
+        self.i2c.readfrom_mem_into(self.address, reg, buf)
+    
     def _set_accel_scale(self):
-        """Set accelerometer scale factor based on range"""
-        scales = {
-            ACCEL_RANGE_2G: ACCEL_SCALE_2G,
-            ACCEL_RANGE_4G: ACCEL_SCALE_4G,
-            ACCEL_RANGE_8G: ACCEL_SCALE_8G,
-            ACCEL_RANGE_16G: ACCEL_SCALE_16G
-        }
-        self.accel_scale = scales.get(self.accel_range, ACCEL_SCALE_2G)
+        """Set accelerometer scale factor and m/s² gain based on range"""
+        self.accel_scale, self.accel_range_g = _ACCEL_RANGES.get(
+            self.accel_range, (ACCEL_SCALE_2G, 2))
+        # Combined LSB -> m/s² multiplier (one multiply per axis per read)
+        self._accel_gain = 9.80665 / self.accel_scale
     
     def _set_gyro_scale(self):
-        """Set gyroscope scale factor based on range"""
-        scales = {
-            GYRO_RANGE_250: GYRO_SCALE_250,
-            GYRO_RANGE_500: GYRO_SCALE_500,
-            GYRO_RANGE_1000: GYRO_SCALE_1000,
-            GYRO_RANGE_2000: GYRO_SCALE_2000
-        }
-        self.gyro_scale = scales.get(self.gyro_range, GYRO_SCALE_250)
-    
-    def _get_accel_range_g(self):
-        """Get accelerometer range in g"""
-        ranges = {
-            ACCEL_RANGE_2G: 2,
-            ACCEL_RANGE_4G: 4,
-            ACCEL_RANGE_8G: 8,
-            ACCEL_RANGE_16G: 16
-        }
-        return ranges.get(self.accel_range, 2)
-    
-    def _get_gyro_range_dps(self):
-        """Get gyroscope range in degrees/second"""
-        ranges = {
-            GYRO_RANGE_250: 250,
-            GYRO_RANGE_500: 500,
-            GYRO_RANGE_1000: 1000,
-            GYRO_RANGE_2000: 2000
-        }
-        return ranges.get(self.gyro_range, 250)
+        """Set gyroscope scale factor and dps gain based on range"""
+        self.gyro_scale, self.gyro_range_dps = _GYRO_RANGES.get(
+            self.gyro_range, (GYRO_SCALE_250, 250))
+        # LSB -> dps multiplier
+        self._gyro_gain = 1.0 / self.gyro_scale
     
     @property
     def acceleration(self):
@@ -206,17 +239,15 @@ class MPU6050:
             raise RuntimeError("Accelerometer not enabled (mode='{}')".format(self.mode))
         
         # Read 6 bytes (X, Y, Z - each 2 bytes)
-        data = self._read_bytes(ACCEL_XOUT_H, 6)
+        self._read_into(ACCEL_XOUT_H, self._rx6)
         
         # Unpack as signed 16-bit values (big-endian)
-        raw_x, raw_y, raw_z = struct.unpack('>hhh', data)
+        raw_x, raw_y, raw_z = struct.unpack_from('>hhh', self._rx)
         
-        # Convert to m/s² (1g = 9.80665 m/s²)
-        x = (raw_x / self.accel_scale) * 9.80665
-        y = (raw_y / self.accel_scale) * 9.80665
-        z = (raw_z / self.accel_scale) * 9.80665
-        
-        return (x, y, z)
+        # Remove bias, convert to m/s² (1g = 9.80665 m/s²)
+        ox, oy, oz = self._accel_off
+        g = self._accel_gain
+        return ((raw_x - ox) * g, (raw_y - oy) * g, (raw_z - oz) * g)
     
     @property
     def gyro(self):
@@ -230,17 +261,15 @@ class MPU6050:
             raise RuntimeError("Gyroscope not enabled (mode='{}')".format(self.mode))
         
         # Read 6 bytes (X, Y, Z - each 2 bytes)
-        data = self._read_bytes(GYRO_XOUT_H, 6)
+        self._read_into(GYRO_XOUT_H, self._rx6)
         
         # Unpack as signed 16-bit values (big-endian)
-        raw_x, raw_y, raw_z = struct.unpack('>hhh', data)
-        
-        # Convert to degrees/second
-        gx = raw_x / self.gyro_scale
-        gy = raw_y / self.gyro_scale
-        gz = raw_z / self.gyro_scale
+        raw_x, raw_y, raw_z = struct.unpack_from('>hhh', self._rx)
         
-        return (gx, gy, gz)
+        # Remove bias, convert to degrees/second
+        ox, oy, oz = self._gyro_off
+        g = self._gyro_gain
+        return ((raw_x - ox) * g, (raw_y - oy) * g, (raw_z - oz) * g)
     
     @property
     def temperature(self):
@@ -251,75 +280,93 @@ class MPU6050:
             Temperature in Celsius
         """
         # Read 2 bytes
-        data = self._read_bytes(TEMP_OUT_H, 2)
+        self._read_into(TEMP_OUT_H, self._rx2)
         
         # Unpack as signed 16-bit value (big-endian)
-        raw_temp = struct.unpack('>h', data)[0]
+        raw_temp = struct.unpack_from('>h', self._rx)[0]
         
         # Convert to Celsius: Temperature = (TEMP_OUT / 340) + 36.53
         temp_c = (raw_temp / 340.0) + 36.53
         
         return temp_c
     
+    @property
+    def data_ready(self):
+        """True if a new sample is available (always True without int_pin)"""
+        if self._int_pin is None:
+            return True
+        return self._int_pin.value
+    
     def read_all(self):
         """
         Read all sensors at once (accelerometer + gyroscope + temperature)
         More efficient than reading individually.
         
+        With int_pin configured, the previous result is returned without
+        any I2C traffic until the sensor signals a new sample.
+        
         Returns:
             Dict with keys: 'accel', 'gyro', 'temp'
         """
+        if self._last_all is not None and not self.data_ready:
+            return self._last_all
+        
         result = {}
         
         if self.mode in ('accel', 'both'):
             # Read accel (6 bytes) + temp (2 bytes) + gyro (6 bytes) = 14 bytes
-            data = self._read_bytes(ACCEL_XOUT_H, 14)
+            self._read_into(ACCEL_XOUT_H, self._rx)
             
-            # Unpack accelerometer
-            raw_ax, raw_ay, raw_az = struct.unpack('>hhh', data[0:6])
-            result['accel'] = (
-                (raw_ax / self.accel_scale) * 9.80665,
-                (raw_ay / self.accel_scale) * 9.80665,
-                (raw_az / self.accel_scale) * 9.80665
-            )
+            # Unpack the whole burst at once: accel XYZ, temp, gyro XYZ
+            raw_ax, raw_ay, raw_az, raw_temp, raw_gx, raw_gy, raw_gz = struct.unpack_from('>hhhhhhh', self._rx)
             
-            # Unpack temperature
-            raw_temp = struct.unpack('>h', data[6:8])[0]
+            ox, oy, oz = self._accel_off
+            g = self._accel_gain
+            result['accel'] = ((raw_ax - ox) * g, (raw_ay - oy) * g, (raw_az - oz) * g)
             result['temp'] = (raw_temp / 340.0) + 36.53
             
             if self.mode == 'both':
-                # Unpack gyroscope
-                raw_gx, raw_gy, raw_gz = struct.unpack('>hhh', data[8:14])
-                result['gyro'] = (
-                    raw_gx / self.gyro_scale,
-                    raw_gy / self.gyro_scale,
-                    raw_gz / self.gyro_scale
-                )
+                ox, oy, oz = self._gyro_off
+                g = self._gyro_gain
+                result['gyro'] = ((raw_gx - ox) * g, (raw_gy - oy) * g, (raw_gz - oz) * g)
         
         elif self.mode == 'gyro':
             # Read gyro only + temp
-            data = self._read_bytes(TEMP_OUT_H, 8)
+            self._read_into(TEMP_OUT_H, self._rx8)
             
-            # Unpack temperature
-            raw_temp = struct.unpack('>h', data[0:2])[0]
+            # Unpack temperature and gyroscope together
+            raw_temp, raw_gx, raw_gy, raw_gz = struct.unpack_from('>hhhh', self._rx)
             result['temp'] = (raw_temp / 340.0) + 36.53
             
-            # Unpack gyroscope
-            raw_gx, raw_gy, raw_gz = struct.unpack('>hhh', data[2:8])
-            result['gyro'] = (
-                raw_gx / self.gyro_scale,
-                raw_gy / self.gyro_scale,
-                raw_gz / self.gyro_scale
-            )
+            ox, oy, oz = self._gyro_off
+            g = self._gyro_gain
+            result['gyro'] = ((raw_gx - ox) * g, (raw_gy - oy) * g, (raw_gz - oz) * g)
         
+        if self._int_pin is not None:
+            self._last_all = result
         return result
     
-    def calibrate_gyro(self, samples=100):
+    def set_accel_offsets(self, x, y, z):
+        """Set accelerometer bias (m/s²) subtracted from every reading"""
+        if self.mode not in ('accel', 'both'):
+            raise ValueError("Accelerometer offsets need mode 'accel' or 'both' (mode='{}')".format(self.mode))
+        g = self._accel_gain
+        self._accel_off = (x / g, y / g, z / g)
+    
+    def set_gyro_offsets(self, x, y, z):
+        """Set gyroscope bias (°/s) subtracted from every reading"""
+        if self.mode not in ('gyro', 'both'):
+            raise ValueError("Gyroscope offsets need mode 'gyro' or 'both' (mode='{}')".format(self.mode))
+        s = self.gyro_scale
+        self._gyro_off = (x * s, y * s, z * s)
+    
+    def calibrate_gyro(self, samples=100, apply=False):
         """
         Calibrate gyroscope by averaging samples at rest
         
         Args:
             samples: Number of samples to average
+            apply: If True, subtract the measured bias from later readings
         
         Returns:
             Tuple of (offset_x, offset_y, offset_z)
@@ -330,52 +377,69 @@ class MPU6050:
         print(f"[MPU6050] Calibrating gyro ({samples} samples)...")
         print("[MPU6050] Keep sensor stationary!")
         
+        # Sum raw counts (one 6-byte burst each) and scale once at the end.
+        # No sleep between reads: the DLPF already smooths the output and
+        # each burst takes ~300 us at 400 kHz.
+        read_into = self._read_into
+        rx6 = self._rx6
+        rx = self._rx
         sum_x = sum_y = sum_z = 0
         
         for i in range(samples):
-            gx, gy, gz = self.gyro
-            sum_x += gx
-            sum_y += gy
-            sum_z += gz
-            time.sleep(0.01)
+            read_into(GYRO_XOUT_H, rx6)
+            raw_x, raw_y, raw_z = struct.unpack_from('>hhh', rx)
+            sum_x += raw_x
+            sum_y += raw_y
+            sum_z += raw_z
         
-        offset_x = sum_x / samples
-        offset_y = sum_y / samples
-        offset_z = sum_z / samples
+        div = samples * self.gyro_scale
+        offset_x = sum_x / div
+        offset_y = sum_y / div
+        offset_z = sum_z / div
         
         print(f"[MPU6050] Gyro offsets: X={offset_x:.2f}, Y={offset_y:.2f}, Z={offset_z:.2f} °/s")
         
+        if apply:
+            # Keep the unrounded raw-count means
+            self._gyro_off = (sum_x / samples, sum_y / samples, sum_z / samples)
+        
         return (offset_x, offset_y, offset_z)
     
     def self_test(self):
         """
         Perform basic self-test
         
+        Intended for boot time only; it is not meant to be called from the
+        main loop.
+        
         Returns:
             True if passed, False if failed
         """
         try:
             # Read WHO_AM_I register (should return 0x68)
-            who_am_i = self._read_bytes(0x75, 1)[0]
+            who_am_i = self._read_bytes(WHO_AM_I, 1)[0]
             if who_am_i != 0x68:
                 print(f"[MPU6050] Self-test FAILED: WHO_AM_I = 0x{who_am_i:02X} (expected 0x68)")
                 return False
             
+            # One burst covers every enabled sensor
+            data = self.read_all()
+            
             # Test accelerometer
-            if self.mode in ('accel', 'both'):
-                accel = self.acceleration
+            accel = data.get('accel')
+            if accel:
                 # Check if values are reasonable (should see ~1g on one axis when stationary)
-                mag = (accel[0]**2 + accel[1]**2 + accel[2]**2)**0.5
-                if mag < 5 or mag > 15:  # Reasonable range: 0.5g to 1.5g
-                    print(f"[MPU6050] Self-test WARNING: Accel magnitude = {mag:.2f} m/s²")
+                mag_sq = accel[0] * accel[0] + accel[1] * accel[1] + accel[2] * accel[2]
+                if mag_sq < 25 or mag_sq > 225:  # Reasonable range: 0.5g to 1.5g
+                    print(f"[MPU6050] Self-test WARNING: Accel magnitude = {mag_sq ** 0.5:.2f} m/s²")
             
             # Test gyroscope
-            if self.mode in ('gyro', 'both'):
-                gyro = self.gyro
+            gyro = data.get('gyro')
+            if gyro:
                 # When stationary, gyro should be near zero
-                mag = (gyro[0]**2 + gyro[1]**2 + gyro[2]**2)**0.5
-                if mag > 50:  # More than 50°/s when stationary is suspicious
-                    print(f"[MPU6050] Self-test WARNING: Gyro magnitude = {mag:.2f} °/s (sensor moving?)")
+                mag_sq = gyro[0] * gyro[0] + gyro[1] * gyro[1] + gyro[2] * gyro[2]
+                if mag_sq > 2500:  # More than 50°/s when stationary is suspicious
+                    print(f"[MPU6050] Self-test WARNING: Gyro magnitude = {mag_sq ** 0.5:.2f} °/s (sensor moving?)")
             
             print("[MPU6050] Self-test PASSED")
             return True
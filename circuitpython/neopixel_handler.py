@@ -5,68 +5,119 @@ neopixel_handler.py - NeoPixel Handler for OpenPonyLogger
 import time
 import math
 
+# Tire colors are memoized per 0.05 g bucket of (gx, gy)
+TIRE_CACHE_SCALE = 20
+TIRE_CACHE_MAX = 1024
+
+# G-force that maps to full brightness on the accel/lateral pixels
+G_COLOR_MAX = 1.5
+
+# Status LED breathing: sin(t * pi / 6), i.e. a 12 s period
+BREATHE_RATE = math.pi / 6
+BREATHE_LEVELS = 32  # Brightness steps; the status pixel only changes per step
+
+
+def _load_to_color(vertical_load):
+    """
+    Map a tire's vertical load share to a color
+    
+    Blue -> green up to 0.5, then green -> yellow; red saturates at 1.0
+    (the old linear ramp ran past 255 up to the 1.5 clamp).
+    """
+    if vertical_load <= 0:
+        return (0, 0, 255)
+    if vertical_load < 0.5:
+        g = int(vertical_load * 510)
+        return (0, g, 255 - g)
+    if vertical_load >= 1.0:
+        return (255, 255, 0)
+    return (int((vertical_load - 0.5) * 510), 255, 0)
+
+
 class NeoPixelHandler:
     def __init__(self, pixel):
         self.pixel = pixel
+        # Frames are staged in the pixel buffer and sent with one show();
+        # auto_write would push the whole strip on every assignment
+        self.pixel.auto_write = False
+        self._tire_cache = {}
+        self._g_scale = 255.0 / G_COLOR_MAX
+        self._last_status_key = None
+        self._last_frame = None
 
     def christmas_tree(self):
         """Startup animation - christmas tree effect"""
         colors = [(255, 191, 0), (255, 191, 0), (255, 191, 0), (0, 255, 0)]
+        pixel = self.pixel
         for c in colors:
             for i in range(7):
-                self.pixel[i] = c
-                self.pixel.show()
+                pixel[i] = c
+                pixel.show()  # One refresh per animation step
                 time.sleep(0.1)
-            self.pixel.show()
             time.sleep(0.5)
-            self.pixel.fill((0, 0, 0))
+            pixel.fill((0, 0, 0))
 
-    def _g_to_color(self, g_value, max_g=1.5):
+    def _g_to_color(self, g_value, max_g=G_COLOR_MAX):
         """Map G-force to color: green=accel, red=decel, brightness=magnitude"""
-        intensity = min(abs(g_value) / max_g, 1.0)
+        scale = self._g_scale if max_g == G_COLOR_MAX else 255.0 / max_g
         if g_value > 0.1:
-            return (0, int(255 * intensity), 0)  # Green for positive
-        elif g_value < -0.1:
-            return (int(255 * intensity), 0, 0)  # Red for negative
-        else:
-            return (0, 0, 0)  # Standing
+            return (0, int(min(g_value * scale, 255)), 0)  # Green for positive
+        if g_value < -0.1:
+            return (int(min(-g_value * scale, 255)), 0, 0)  # Red for negative
+        return (0, 0, 0)  # Standing
 
     def _tire_load_color(self, gx, gy, position):
         """
         Calculate tire load color based on weight transfer
         Position: 'rf', 'rr', 'lf', 'lr'
         """
-        vertical_load = 0.25
-        
-        if position in ['rf', 'lf']:
-            vertical_load += -gy * 0.3
-        else:
-            vertical_load += gy * 0.3
-        
-        if position in ['rf', 'rr']:
-            vertical_load += -gx * 0.3
-        else:
-            vertical_load += gx * 0.3
-        
-        vertical_load = max(0, min(vertical_load, 1.5))
-        intensity = abs(vertical_load)
-        
         if abs(gx) < 0.1 and abs(gy) < 0.1:
-            r, g, b = 0, 0, 0
-        elif intensity < 0.5:
-            r = 0
-            g = int(intensity * 2 * 255)
-            b = int((1 - intensity * 2) * 255)
-        else:
-            r = int((intensity - 0.5) * 2 * 255)
-            g = 255
-            b = 0
+            return (0, 0, 0)
+        
+        gx3 = gx * 0.3
+        gy3 = gy * 0.3
+        vertical_load = 0.25
+        vertical_load += -gy3 if position in ('rf', 'lf') else gy3
+        vertical_load += -gx3 if position in ('rf', 'rr') else gx3
+        return _load_to_color(vertical_load)
+
+    def _tire_colors(self, gx, gy):
+        """
+        Return the (rf, rr, lr, lf) tire colors for a G-force reading
         
-        return (r, g, b)
+        Colors are computed once per quantized (gx, gy) bucket and cached;
+        consecutive frames almost always land in the same bucket.
+        """
+        qx = int(gx * TIRE_CACHE_SCALE)
+        qy = int(gy * TIRE_CACHE_SCALE)
+        key = (qx, qy)
+        colors = self._tire_cache.get(key)
+        if colors is None:
+            bx = qx / TIRE_CACHE_SCALE
+            by = qy / TIRE_CACHE_SCALE
+            if abs(bx) < 0.1 and abs(by) < 0.1:
+                colors = ((0, 0, 0),) * 4
+            else:
+                # All four corners share the same weight-transfer terms
+                gx3 = bx * 0.3
+                gy3 = by * 0.3
+                front = 0.25 - gy3
+                rear = 0.25 + gy3
+                colors = (_load_to_color(front - gx3),   # rf
+                          _load_to_color(rear - gx3),    # rr
+                          _load_to_color(rear + gx3),    # lr
+                          _load_to_color(front + gx3))   # lf
+            if len(self._tire_cache) >= TIRE_CACHE_MAX:
+                self._tire_cache.clear()
+            self._tire_cache[key] = colors
+        return colors
 
     def update(self, data):
         """
         Update NeoPixel Jewel based on G-force and system status
+        
+        All seven pixels are staged first and sent with a single show().
+        Nothing is written when the frame would look the same as the last one.
         """
         gx = data['accel']['gx']
         gy = data['accel']['gy']
@@ -83,16 +134,40 @@ class NeoPixelHandler:
         
         if breathe:
             t = time.monotonic()
-            intensity = 0.2 + 0.3 * (1 + math.sin(t / 6 * math.pi))
-            self.pixel[0] = tuple(int(c * intensity) for c in status_color)
+            level = int((0.2 + 0.3 * (1 + math.sin(t * BREATHE_RATE))) * BREATHE_LEVELS)
         else:
-            self.pixel[0] = status_color
+            level = BREATHE_LEVELS
+        
+        # The pixel buffer keeps pixel[0] between frames, so it is only
+        # recomputed when the color or breathing step changes
+        status_key = (status_color, level)
+        if status_key != self._last_status_key:
+            self._last_status_key = status_key
+            if breathe:
+                # Intensity as a /256 fixed-point factor; integer scaling avoids
+                # a float multiply and a generator/tuple build per channel
+                iscaled = level * (256 // BREATHE_LEVELS)
+                sr, sg, sb = status_color
+                self.pixel[0] = ((sr * iscaled) >> 8, (sg * iscaled) >> 8, (sb * iscaled) >> 8)
+            else:
+                self.pixel[0] = status_color
+        
+        tires = self._tire_colors(gx, gy)
+        lat_color = self._g_to_color(gy)
+        long_color = self._g_to_color(gx)
+        
+        # Skip the strip refresh entirely when nothing visible changed
+        frame = (status_key, lat_color, long_color, tires)
+        if frame == self._last_frame:
+            return
+        self._last_frame = frame
         
-        self.pixel[1] = self._g_to_color(gy)
-        self.pixel[2] = self._tire_load_color(gx, gy, 'rf')
-        self.pixel[3] = self._tire_load_color(gx, gy, 'rr')
-        self.pixel[4] = self._g_to_color(gx)
-        self.pixel[5] = self._tire_load_color(gx, gy, 'lr')
-        self.pixel[6] = self._tire_load_color(gx, gy, 'lf')
+        rf, rr, lr, lf = tires
+        self.pixel[1] = lat_color
+        self.pixel[2] = rf
+        self.pixel[3] = rr
+        self.pixel[4] = long_color
+        self.pixel[5] = lr
+        self.pixel[6] = lf
         
         self.pixel.show()
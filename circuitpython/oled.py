@@ -4,12 +4,26 @@ oled.py - OLED Display Manager for OpenPonyLogger
 
 import displayio
 import terminalio
-from adafruit_display_text import label
+from adafruit_display_text import label, bitmap_label
 from utils import format_dms, hdop_to_bars, format_time_hms, estimate_recording_time
 import os
 import time
+import math
+
+# Main screen line templates (one %-format per line per refresh)
+_LINE1_FMT = "%02d:%02d:%02d%s %-5s %.1f"
+_LINE2_FMT = "%s %s"
+_LINE3_FMT = "%3.0fMPH  %+.2fg"
+
+# Free space changes slowly; re-query the SD card at most this often (seconds)
+SD_STAT_TTL = 2.0
 
 class OLED:
+    # G-force smoothing: 1/16 EMA on m/s^2 input, converted to g
+    _ALPHA = 1.0 / 16.0
+    _ONE_M = 1.0 - _ALPHA
+    _INV_G = 1.0 / 9.81
+
     def __init__(self, display):
         self.display = display
         self.splash_group = None
@@ -20,17 +34,32 @@ class OLED:
         self.line3 = None
         self.line4 = None
         self.line5 = None
+        self._lines = ()
+        self._last_text = ['', '', '', '', '']
+        self._sd_free = 0
+        self._sd_stat_time = None
         self.smooth_x = 0.0
         self.smooth_y = 0.0
 
     def show_splash(self, status_text="Initializing..."):
         """Display OpenPony splash screen"""
+        if self.splash_group is None:
+            self._build_splash(status_text)
+        else:
+            self.splash_status.text = status_text
+        
+        self.display.root_group = self.splash_group
+
+    def _build_splash(self, status_text):
+        """Build the splash group once; later calls only update the status"""
         self.splash_group = displayio.Group()
 
+        # Static text is rendered to bitmaps once (bitmap_label keeps no
+        # per-glyph TileGrids around)
         # Title (Large font)
-        title = label.Label(terminalio.FONT, text="OpenPony", color=0xFFFFFF, x=5, y=8, scale=2)
+        title = bitmap_label.Label(terminalio.FONT, text="OpenPony", color=0xFFFFFF, x=5, y=8, scale=2)
         self.splash_group.append(title)
-        title = label.Label(terminalio.FONT, text="Logger", color=0xFFFFFF, x=10, y=22, scale=1)
+        title = bitmap_label.Label(terminalio.FONT, text="Logger", color=0xFFFFFF, x=10, y=22, scale=1)
         self.splash_group.append(title)
         
         # Status (middle)
@@ -38,10 +67,8 @@ class OLED:
         self.splash_group.append(self.splash_status)
         
         # Copyright (bottom)
-        copyright_label = label.Label(terminalio.FONT, text="(c) John Orthoefer 2025", color=0xFFFFFF, x=0, y=57)
+        copyright_label = bitmap_label.Label(terminalio.FONT, text="(c) John Orthoefer 2025", color=0xFFFFFF, x=0, y=57)
         self.splash_group.append(copyright_label)
-        
-        self.display.root_group = self.splash_group
 
     def setup_main_display(self):
         """Setup the main display screen"""
@@ -53,8 +80,10 @@ class OLED:
         self.line4 = label.Label(terminalio.FONT, text="NoLog 00:00:00", color=0xFFFFFF, x=0, y=41)
         self.line5 = label.Label(terminalio.FONT, text="SD: --h --m remain", color=0xFFFFFF, x=0, y=53)
 
-        for line in [self.line1, self.line2, self.line3, self.line4, self.line5]:
+        self._lines = (self.line1, self.line2, self.line3, self.line4, self.line5)
+        for i, line in enumerate(self._lines):
             self.main_group.append(line)
+            self._last_text[i] = line.text
             
         if self.splash_status:
             self.splash_status.text = "Display ready..."
@@ -66,55 +95,66 @@ class OLED:
 
         # Line 1: {HH:MM:SS} {GPS Fix} {HDOP bars}
         now = time.localtime()
-        time_str = f"{now.tm_hour:02d}:{now.tm_min:02d}:{now.tm_sec:02d}"
-        if rtc_handler.synced:
-            time_str += chr(0x0f)
-        else:
-            time_str += chr(0x07)
-        
-        fix_str = "NoFix"
-        hdop = 25.0
-        fix_str = data['gps']['fix']
-        hdop = data['gps']['hdop']
+        sync_mark = chr(0x0f) if rtc_handler.synced else chr(0x07)
+        gps = data['gps']
+        accel = data['accel']
 
-        self.line1.text = f"{time_str} {fix_str:5s} {hdop:.1f}"
+        self._set_line(0, _LINE1_FMT % (now.tm_hour, now.tm_min, now.tm_sec,
+                                        sync_mark, gps['fix'], gps['hdop']))
         
         # Line 2: Lat/Long
-        self.line2.text = f"{data['gps']['lat']} {data['gps']['lon']}"
+        self._set_line(1, _LINE2_FMT % (gps['lat'], gps['lon']))
         
         # Line 3: {MPH} {Total G Force}
-        self.line3.text = f"{data['gps']['speed']:3.0f}MPH  {self._smooth_g(data['accel']['ax'], data['accel']['ay']):+.2f}g"
+        self._set_line(2, _LINE3_FMT % (gps['speed'], self._smooth_g(accel['ax'], accel['ay'])))
         
         # Line 4: {Log file name} {File record time}
         if session.active:
             duration = format_time_hms(session.get_duration())
             no_ext = (session.filename.split("."))[0]
             short_name = no_ext.split("_")[1] if session.filename else "NoLog"
-            self.line4.text = f"Run:{short_name} {duration}"
+            self._set_line(3, f"Run:{short_name} {duration}")
         else:
-            self.line4.text = "NoLog 00:00:00"
+            self._set_line(3, "NoLog 00:00:00")
         
         # Line 5: {Estimate of SD Card remaining time}
         if session.active:
             bytes_per_sec = session.get_bytes_per_second()
             # Get current free space
-            sd_stat = os.statvfs("/sd")
-            free_bytes = sd_stat[0] * sd_stat[3]
+            free_bytes = self._sd_free_bytes()
             remaining = estimate_recording_time(free_bytes, bytes_per_sec)
-            self.line5.text = f"SD: {remaining} remain"
+            self._set_line(4, f"SD: {remaining} remain")
         else:
             # Show total free space in GB
+            free_gb = self._sd_free_bytes() / (1024**3)
+            self._set_line(4, f"SD: {free_gb:.1f}GB free")
+        
+        # Only switch back if something else (e.g. the splash) took the screen;
+        # re-assigning the same group forces a full redraw
+        if self.display.root_group is not self.main_group:
+            self.display.root_group = self.main_group
+
+    def _sd_free_bytes(self):
+        """Free bytes on /sd, cached for SD_STAT_TTL seconds"""
+        now = time.monotonic()
+        if self._sd_stat_time is None or now - self._sd_stat_time >= SD_STAT_TTL:
             sd_stat = os.statvfs("/sd")
-            free_gb = (sd_stat[0] * sd_stat[3]) / (1024**3)
-            self.line5.text = f"SD: {free_gb:.1f}GB free"
-        self.display.root_group = self.main_group
+            self._sd_free = sd_stat[0] * sd_stat[3]
+            self._sd_stat_time = now
+        return self._sd_free
+
+    def _set_line(self, index, text):
+        """Set a main-screen line, skipping the re-render if the text is unchanged"""
+        if text != self._last_text[index]:
+            self._lines[index].text = text
+            self._last_text[index] = text
 
     def _smooth_g(self, new_x, new_y):
-        self.smooth_x = ((self.smooth_x * 16) - self.smooth_x + new_x)/16
-        self.smooth_y = ((self.smooth_y * 16) - self.smooth_y + new_y)/16
-        gx = self.smooth_x/9.81
-        gy = self.smooth_y/9.81
-        return (gx**2 + gy**2)**0.5
+        self.smooth_x = self.smooth_x * self._ONE_M + new_x * self._ALPHA
+        self.smooth_y = self.smooth_y * self._ONE_M + new_y * self._ALPHA
+        gx = self.smooth_x * self._INV_G
+        gy = self.smooth_y * self._INV_G
+        return math.sqrt(gx * gx + gy * gy)
 
     def set_splash_status(self, text):
         if self.splash_status:
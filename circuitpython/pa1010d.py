@@ -35,12 +35,80 @@ NMEA_GSA = b'$GPGSA'  # DOP and active satellites
 NMEA_GSV = b'$GPGSV'  # Satellites in view
 NMEA_VTG = b'$GPVTG'  # Track and ground speed
 
+# Upper bound on read/parse passes per update() call
+MAX_SENTENCES_PER_CALL = const(8)
+
 # GPS fix quality
 FIX_INVALID = const(0)
 FIX_GPS = const(1)
 FIX_DGPS = const(2)
 
 
+# 10**n for the fractional-minute digits in ddmm.mmmm fields
+_POW10 = (1, 10, 100, 1000, 10000, 100000, 1000000, 10000000, 100000000, 1000000000)
+
+
+def _nmea_coord(field):
+    """
+    Convert an NMEA ddmm.mmmm / dddmm.mmmm field to decimal degrees
+    
+    Degrees and minutes are parsed as integers; the only float operation
+    is the final divide (the RP2040 has no FPU).
+    """
+    dot = field.find(b'.')
+    if dot < 0:
+        dot = len(field)
+        frac = 0
+        scale = 1
+    else:
+        digits = len(field) - dot - 1
+        frac = int(field[dot + 1:]) if digits else 0
+        scale = _POW10[digits]
+    split = dot - 2 if dot > 2 else 0
+    deg = int(field[:split]) if split else 0
+    minutes_scaled = (int(field[split:dot]) if dot else 0) * scale + frac
+    return deg + minutes_scaled / (60 * scale)
+
+
+def _nmea_xor(buf, start, end):
+    """
+    XOR of buf[start:end] (the NMEA checksum)
+    
+    Works 8 bytes at a time (int.from_bytes runs in C), then folds the
+    64-bit accumulator down to one byte and XORs the 0-7 tail bytes.
+    """
+    words_end = start + ((end - start) & ~7)
+    acc = 0
+    for i in range(start, words_end, 8):
+        acc ^= int.from_bytes(buf[i:i + 8], 'little')
+    acc ^= acc >> 32
+    acc ^= acc >> 16
+    acc ^= acc >> 8
+    acc &= 0xFF
+    for i in range(words_end, end):
+        acc ^= buf[i]
+    return acc
+
+
+def _pmtk_packet(command):
+    """Frame a PMTK command as $<command>*<checksum>\r\n bytes"""
+    data = command.encode('ascii')
+    return ("$%s*%02X\r\n" % (command, _nmea_xor(data, 0, len(data)))).encode('ascii')
+
+
+# Fixed PMTK packets, framed once at import
+_CMD_HOT_START = _pmtk_packet("PMTK101")
+_CMD_WARM_START = _pmtk_packet("PMTK102")
+_CMD_COLD_START = _pmtk_packet("PMTK103")
+_CMD_FACTORY_RESET = _pmtk_packet("PMTK104")
+_CMD_STANDBY = _pmtk_packet("PMTK161,0")
+_CMD_UPDATE_RATE = {
+    1: _pmtk_packet("PMTK220,1000"),   # 1 Hz = 1000ms
+    5: _pmtk_packet("PMTK220,200"),    # 5 Hz = 200ms
+    10: _pmtk_packet("PMTK220,100"),   # 10 Hz = 100ms
+}
+
+
 class PA1010D:
     """
     PA1010D GPS module driver
@@ -74,12 +142,24 @@ class PA1010D:
         elif self.mode == 'i2c':
             self.i2c = interface
             self.uart = None
-            # Check if GPS is present on I2C
-            if PA1010D_ADDR not in self.i2c.scan():
+            # Check if GPS is present on I2C: one 1-byte probe read instead
+            # of scanning every address (the byte is a throwaway NMEA char)
+            try:
+                self.i2c.readfrom_into(PA1010D_ADDR, bytearray(1))
+            except OSError:
                 raise RuntimeError(f"PA1010D not found at I2C address 0x{PA1010D_ADDR:02X}")
         else:
             raise ValueError("mode must be 'uart' or 'i2c'")
         
+        # Interface is fixed for the driver's lifetime; bind the I/O paths
+        # once so update() and send_command() don't re-check the mode
+        if self.mode == 'uart':
+            self._read = self._read_uart
+            self._write = self.uart.write
+        else:
+            self._read = self._read_i2c
+            self._write = self._write_i2c
+        
         # GPS state
         self.latitude = None
         self.longitude = None
@@ -96,6 +176,19 @@ class PA1010D:
         # Buffer for partial sentences
         self._buffer = bytearray()
         
+        # Reusable I2C read buffer (PA1010D serves up to 255 bytes per read)
+        self._i2c_buf = bytearray(255)
+        self._i2c_mv = memoryview(self._i2c_buf)
+        
+        # Sentence type -> (parser, maxsplit), so dispatch is one dict
+        # lookup. maxsplit stops splitting after the last field the parser
+        # reads; the unused tail stays in one piece.
+        self._parsers = {
+            NMEA_GGA: (self._parse_gga, 10),   # Fields 1-9
+            NMEA_RMC: (self._parse_rmc, 10),   # Fields 1-9
+            NMEA_GSA: (self._parse_gsa, 17),   # Field 16 (HDOP)
+        }
+        
         print(f"[PA1010D] Initialized in {mode.upper()} mode")
     
     def _read_uart(self):
@@ -109,22 +202,29 @@ class PA1010D:
         """Read available data from I2C"""
         try:
             # PA1010D can provide up to 255 bytes at a time over I2C
-            data = bytearray(255)
+            data = self._i2c_buf
             self.i2c.readfrom_into(PA1010D_ADDR, data)
             
             # Find actual data (stop at first 0x0A or null)
-            end_idx = 0
-            for i, byte in enumerate(data):
-                if byte == 0x0A or byte == 0x00:
-                    end_idx = i + 1
-                    break
+            nl = data.find(b'\n')
+            nul = data.find(b'\x00')
+            if nl < 0:
+                end_idx = nul
+            elif nul < 0:
+                end_idx = nl
+            else:
+                end_idx = min(nl, nul)
             
-            if end_idx > 0:
-                self._buffer.extend(data[:end_idx])
+            if end_idx >= 0:
+                self._buffer.extend(self._i2c_mv[:end_idx + 1])
         except OSError:
             # No data available
             pass
     
+    def _write_i2c(self, data):
+        """Write raw bytes to the module over I2C"""
+        self.i2c.writeto(PA1010D_ADDR, data)
+    
     def update(self):
         """
         Read and process GPS data
@@ -132,23 +232,43 @@ class PA1010D:
         Returns:
             True if new data was processed, False otherwise
         """
-        # Read data from interface
-        if self.mode == 'uart':
-            self._read_uart()
-        else:
-            self._read_i2c()
-        
-        # Process complete NMEA sentences
+        # Keep reading while each pass yields complete sentences, so a
+        # backlog in the module's FIFO is drained in one call. An I2C read
+        # returns at most one sentence, so this also bounds the work per call.
         updated = False
-        while b'\n' in self._buffer:
-            # Extract one sentence
-            line_end = self._buffer.index(b'\n')
-            sentence = bytes(self._buffer[:line_end])
-            self._buffer = self._buffer[line_end + 1:]
+        for _ in range(MAX_SENTENCES_PER_CALL):
+            # Read data from interface
+            self._read()
+            
+            # Process complete NMEA sentences, walking a head index instead
+            # of re-slicing the buffer after every line
+            buf = self._buffer
+            buf_mv = memoryview(buf)
+            head = 0
+            got_sentence = False
+            while True:
+                # Extract one sentence
+                line_end = buf.find(b'\n', head)
+                if line_end < 0:
+                    break
+                if line_end - head > 1:  # Skip idle padding / bare \r\n
+                    got_sentence = True
+                    # One copy straight out of the buffer (slicing the
+                    # bytearray first would copy twice)
+                    sentence = bytes(buf_mv[head:line_end])
+                    
+                    # Parse sentence
+                    if self._parse_sentence(sentence):
+                        updated = True
+                head = line_end + 1
+            
+            # Drop consumed lines once; only a partial sentence is left to copy
+            buf_mv = None  # Release the view before the buffer is extended again
+            if head:
+                self._buffer = buf[head:]
             
-            # Parse sentence
-            if self._parse_sentence(sentence):
-                updated = True
+            if not got_sentence:
+                break  # FIFO drained
         
         return updated
     
@@ -163,42 +283,38 @@ class PA1010D:
             True if sentence was parsed successfully
         """
         # Remove \r if present
-        sentence = sentence.rstrip(b'\r')
+        if sentence[-1:] == b'\r':
+            sentence = sentence[:-1]
         
         # Check for valid sentence
-        if not sentence.startswith(b'$'):
+        if sentence[:1] != b'$':
+            return False
+        
+        # Look up the sentence type first; types nobody parses (GSV, VTG,
+        # ...) are dropped before any checksum or split work
+        comma = sentence.find(b',')
+        if comma < 0:
+            return False
+        parser = self._parsers.get(sentence[:comma])
+        if parser is None:
             return False
+        handler, maxsplit = parser
         
-        # Verify checksum if present
-        if b'*' in sentence:
-            data, checksum = sentence.rsplit(b'*', 1)
+        # Verify checksum if present (one rfind; XOR runs on the sentence
+        # in place, so the payload is never copied out)
+        star = sentence.rfind(b'*')
+        if star >= 0:
             try:
-                expected = int(checksum, 16)
-                actual = 0
-                for byte in data[1:]:  # Skip $
-                    actual ^= byte
+                expected = int(sentence[star + 1:], 16)
+                actual = _nmea_xor(sentence, 1, star)  # Skip $
                 if actual != expected:
                     return False
             except ValueError:
                 return False
+            sentence = sentence[:star]
         
-        # Split into fields
-        try:
-            fields = sentence.split(b',')
-        except:
-            return False
-        
-        # Parse based on sentence type
-        sentence_type = fields[0]
-        
-        if sentence_type == NMEA_GGA:
-            return self._parse_gga(fields)
-        elif sentence_type == NMEA_RMC:
-            return self._parse_rmc(fields)
-        elif sentence_type == NMEA_GSA:
-            return self._parse_gsa(fields)
-        
-        return False
+        # Split into fields and parse based on sentence type
+        return handler(sentence.split(b',', maxsplit))
     
     def _parse_gga(self, fields):
         """Parse $GPGGA sentence (fix data)"""
@@ -209,19 +325,13 @@ class PA1010D:
             
             # Latitude (ddmm.mmmm)
             if fields[2] and fields[3]:
-                lat = float(fields[2])
-                lat_deg = int(lat / 100)
-                lat_min = lat - (lat_deg * 100)
-                self.latitude = lat_deg + lat_min / 60.0
+                self.latitude = _nmea_coord(fields[2])
                 if fields[3] == b'S':
                     self.latitude = -self.latitude
             
             # Longitude (dddmm.mmmm)
             if fields[4] and fields[5]:
-                lon = float(fields[4])
-                lon_deg = int(lon / 100)
-                lon_min = lon - (lon_deg * 100)
-                self.longitude = lon_deg + lon_min / 60.0
+                self.longitude = _nmea_coord(fields[4])
                 if fields[5] == b'W':
                     self.longitude = -self.longitude
             
@@ -258,19 +368,13 @@ class PA1010D:
             
             # Latitude
             if fields[3] and fields[4]:
-                lat = float(fields[3])
-                lat_deg = int(lat / 100)
-                lat_min = lat - (lat_deg * 100)
-                self.latitude = lat_deg + lat_min / 60.0
+                self.latitude = _nmea_coord(fields[3])
                 if fields[4] == b'S':
                     self.latitude = -self.latitude
             
             # Longitude
             if fields[5] and fields[6]:
-                lon = float(fields[5])
-                lon_deg = int(lon / 100)
-                lon_min = lon - (lon_deg * 100)
-                self.longitude = lon_deg + lon_min / 60.0
+                self.longitude = _nmea_coord(fields[5])
                 if fields[6] == b'W':
                     self.longitude = -self.longitude
             
@@ -318,22 +422,14 @@ class PA1010D:
         Args:
             command: PMTK command string (e.g., "PMTK314,0,1,0,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0")
         """
-        # Calculate checksum
-        checksum = 0
-        for char in command:
-            checksum ^= ord(char)
-        
-        # Format command
-        cmd = f"${command}*{checksum:02X}\r\n"
-        
-        # Send via appropriate interface
-        if self.mode == 'uart':
-            self.uart.write(cmd.encode('ascii'))
-        else:
-            # I2C mode - PA1010D accepts commands over I2C
-            self.i2c.writeto(PA1010D_ADDR, cmd.encode('ascii'))
+        self._send_packet(_pmtk_packet(command))
+    
+    def _send_packet(self, packet):
+        """Send an already framed PMTK packet"""
+        # Send via appropriate interface (PA1010D accepts commands over I2C too)
+        self._write(packet)
         
-        print(f"[PA1010D] Sent: {cmd.strip()}")
+        print(f"[PA1010D] Sent: {packet.decode('ascii').strip()}")
     
     def set_update_rate(self, rate_hz):
         """
@@ -342,14 +438,7 @@ class PA1010D:
         Args:
             rate_hz: Update rate in Hz (1, 5, or 10)
         """
-        rate_map = {
-            1: 1000,   # 1 Hz = 1000ms
-            5: 200,    # 5 Hz = 200ms
-            10: 100    # 10 Hz = 100ms
-        }
-        
-        interval = rate_map.get(rate_hz, 1000)
-        self.send_command(f"PMTK220,{interval}")
+        self._send_packet(_CMD_UPDATE_RATE.get(rate_hz, _CMD_UPDATE_RATE[1]))
     
     def set_output_sentences(self, gga=True, rmc=True, vtg=False, gsa=False, gsv=False):
         """
@@ -375,24 +464,24 @@ class PA1010D:
     
     def factory_reset(self):
         """Reset GPS to factory defaults"""
-        self.send_command("PMTK104")
+        self._send_packet(_CMD_FACTORY_RESET)
         time.sleep(1)
     
     def hot_start(self):
         """Hot start (use all available data)"""
-        self.send_command("PMTK101")
+        self._send_packet(_CMD_HOT_START)
     
     def warm_start(self):
         """Warm start (don't use ephemeris)"""
-        self.send_command("PMTK102")
+        self._send_packet(_CMD_WARM_START)
     
     def cold_start(self):
         """Cold start (clear all data)"""
-        self.send_command("PMTK103")
+        self._send_packet(_CMD_COLD_START)
     
     def standby_mode(self):
         """Enter standby mode (low power)"""
-        self.send_command("PMTK161,0")
+        self._send_packet(_CMD_STANDBY)
     
     def get_info(self):
         """
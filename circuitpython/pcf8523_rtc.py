@@ -9,6 +9,9 @@ import rtc
 import board
 import busio
 
+# Timestamp template for log/status messages (YYYY-MM-DD HH:MM:SS)
+_TS_FMT = "%04d-%02d-%02d %02d:%02d:%02d"
+
 
 class PCF8523Handler:
     """Handler for PCF8523 Real-Time Clock"""
@@ -28,11 +31,15 @@ class PCF8523Handler:
         self.sync_from_rtc = sync_from
         self.sync_to_rtc = sync_to
         self.rtc_device = None
+        self._has_battery_low = False
+        self._system_rtc = rtc.RTC()
         
         # Import PCF8523 library
         try:
             from adafruit_pcf8523.pcf8523 import PCF8523
             self.rtc_device = PCF8523(i2c)
+            # Probe once; older library versions lack battery_low
+            self._has_battery_low = hasattr(self.rtc_device, 'battery_low')
             print(f"✓ PCF8523 RTC initialized at 0x{address:02X}")
             
             # Sync from RTC to system on boot
@@ -63,10 +70,10 @@ class PCF8523Handler:
             # System time.struct_time needs same format
             
             # Set system RTC
-            rtc.RTC().datetime = rtc_time
+            self._system_rtc.datetime = rtc_time
             
             # Format for display
-            time_str = "{:04d}-{:02d}-{:02d} {:02d}:{:02d}:{:02d}".format(
+            time_str = _TS_FMT % (
                 rtc_time.tm_year, rtc_time.tm_mon, rtc_time.tm_mday,
                 rtc_time.tm_hour, rtc_time.tm_min, rtc_time.tm_sec
             )
@@ -93,7 +100,7 @@ class PCF8523Handler:
             self.rtc_device.datetime = system_time
             
             # Format for display
-            time_str = "{:04d}-{:02d}-{:02d} {:02d}:{:02d}:{:02d}".format(
+            time_str = _TS_FMT % (
                 system_time.tm_year, system_time.tm_mon, system_time.tm_mday,
                 system_time.tm_hour, system_time.tm_min, system_time.tm_sec
             )
@@ -113,16 +120,12 @@ class PCF8523Handler:
             dt : struct_datetime
         """
 
-        year   = new_time.tm_year
-        month  = new_time.tm_mon
-        day    = new_time.tm_mday
-        hour   = new_time.tm_hour
-        minute = new_time.tm_min
-        second = new_time.tm_sec
-        
         # Set system RTC
-        rtc.RTC().datetime = new_time
-        print(f"[RTC] System time set: {year:04d}-{month:02d}-{day:02d} {hour:02d}:{minute:02d}:{second:02d}")
+        self._system_rtc.datetime = new_time
+        print("[RTC] System time set: " + _TS_FMT % (
+            new_time.tm_year, new_time.tm_mon, new_time.tm_mday,
+            new_time.tm_hour, new_time.tm_min, new_time.tm_sec
+        ))
         
         # Optionally sync to PCF8523
         if self.sync_to_rtc and self.rtc_device:
@@ -150,7 +153,7 @@ class PCF8523Handler:
         """
         current_time = self.get_time()
         if current_time:
-            return "{:04d}-{:02d}-{:02d} {:02d}:{:02d}:{:02d}".format(
+            return _TS_FMT % (
                 current_time.tm_year, current_time.tm_mon, current_time.tm_mday,
                 current_time.tm_hour, current_time.tm_min, current_time.tm_sec
             )
@@ -165,10 +168,9 @@ class PCF8523Handler:
         """
         try:
             # PCF8523 has battery_low property
-            if hasattr(self.rtc_device, 'battery_low'):
-                if self.rtc_device.battery_low:
-                    print("[RTC] WARNING: Battery low!")
-                    return False
+            if self._has_battery_low and self.rtc_device.battery_low:
+                print("[RTC] WARNING: Battery low!")
+                return False
             return True
         except Exception as e:
             print(f"[RTC] Failed to check battery: {e}")
@@ -7,22 +7,41 @@ Handles syncing the Pico's RTC from GPS time with proper timezone conversion
 import time
 import rtc
 
+try:
+    import traceback
+except ImportError:
+    traceback = None
+
+# Display templates (single %-format each)
+_TIME_FMT = "%02d:%02d:%02d"
+_DATE_FMT = "%d-%02d-%02d"
+
+# ISO timestamp template (separators stay put; digits are overwritten)
+_ISO_TEMPLATE = b"0000-00-00T00:00:00"
+_ISO_UNSYNCED = b"----------T--:--:--"
+
+# Months fully inside US DST, as a bitmap indexed by month (bits 4-10)
+_DST_FULL_MONTHS = 0b0111_1111_0000
+
 class RTCHandler:
     """Manage RTC synchronization from GPS"""
     
-    def __init__(self, timezone_offset=-5, auto_dst=True):
+    def __init__(self, timezone_offset=-5, auto_dst=True, debug=False):
         """
         Initialize RTC handler
         
         Args:
             timezone_offset: Hours offset from UTC (e.g., -5 for EST, -8 for PST)
             auto_dst: Automatically apply DST rules (US rules)
+            debug: Print full tracebacks when a sync fails
         """
         self.rtc = rtc.RTC()
         self.timezone_offset = timezone_offset
         self.auto_dst = auto_dst
         self.synced = False
         self.last_sync_time = 0
+        self.debug = debug
+        self._ts_buf = bytearray(_ISO_TEMPLATE)
     
     def is_dst(self, year, month, day, hour):
         """
@@ -37,24 +56,18 @@ class RTCHandler:
         if not self.auto_dst:
             return False
         
-        # DST doesn't apply in these months
-        if month < 3 or month > 11:
-            return False
-        if month > 3 and month < 11:
+        # April-October are always DST
+        if _DST_FULL_MONTHS & (1 << month):
             return True
         
-        # Find second Sunday in March (DST starts 2am)
-        # Find first Sunday in November (DST ends 2am)
-        # Simple approximation: DST active if in April-October
-        # For March/November, need day-of-week calculation
-        
         # Simplified: if month is 3 (March) or 11 (November), assume mid-month
+        # instead of finding the 2nd Sunday in March / 1st Sunday in November
         if month == 3:
             return day > 14  # After mid-March
         if month == 11:
             return day < 7   # Before early November
         
-        return True
+        return False
     
     def sync_from_gps(self, gps):
         """
@@ -93,72 +106,27 @@ class RTCHandler:
                 offset += 1
                 print(f"[RTC] Applying DST (offset: {offset})")
             
-            # Apply timezone offset
-            local_hour = hour + offset
-            local_day = day
-            local_month = month
-            local_year = year
-            
-            # Handle day rollover
-            if local_hour >= 24:
-                local_hour -= 24
-                local_day += 1
-                
-                # Handle month rollover
-                days_in_month = [31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31]
-                if local_year % 4 == 0 and (local_year % 100 != 0 or local_year % 400 == 0):
-                    days_in_month[1] = 29
-                
-                if local_day > days_in_month[local_month - 1]:
-                    local_day = 1
-                    local_month += 1
-                    if local_month > 12:
-                        local_month = 1
-                        local_year += 1
-            
-            elif local_hour < 0:
-                local_hour += 24
-                local_day -= 1
-                
-                # Handle month underflow
-                if local_day < 1:
-                    local_month -= 1
-                    if local_month < 1:
-                        local_month = 12
-                        local_year -= 1
-                    
-                    days_in_month = [31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31]
-                    if local_year % 4 == 0 and (local_year % 100 != 0 or local_year % 400 == 0):
-                        days_in_month[1] = 29
-                    
-                    local_day = days_in_month[local_month - 1]
+            # Apply timezone offset in epoch seconds; mktime/localtime
+            # handle day, month and year rollover
+            utc_epoch = time.mktime((year, month, day, hour, minute, second, 0, -1, -1))
+            local = time.localtime(utc_epoch + int(offset * 3600))
             
             # Set RTC
-            self.rtc.datetime = time.struct_time((
-                local_year,
-                local_month,
-                local_day,
-                local_hour,
-                minute,
-                second,
-                0,  # weekday (calculated by RTC)
-                -1,  # yearday (calculated by RTC)
-                -1   # DST flag
-            ))
+            self.rtc.datetime = local
             
             self.synced = True
             self.last_sync_time = time.monotonic()
             
-            print(f"[RTC] ✓ Synced: {local_year}-{local_month:02d}-{local_day:02d} " + 
-                  f"{local_hour:02d}:{minute:02d}:{second:02d} " +
+            print(f"[RTC] ✓ Synced: {local.tm_year}-{local.tm_mon:02d}-{local.tm_mday:02d} " + 
+                  f"{local.tm_hour:02d}:{local.tm_min:02d}:{local.tm_sec:02d} " +
                   f"(UTC {hour:02d}:{minute:02d}, offset {offset})")
             
             return True
             
         except Exception as e:
             print(f"[RTC] Sync failed: {e}")
-            import traceback
-            traceback.print_exception(e)
+            if self.debug and traceback:
+                traceback.print_exception(e)
             return False
     
     def get_time_string(self):
@@ -167,7 +135,42 @@ class RTCHandler:
             return "--:--:--"
         
         now = time.localtime()
-        return f"{now.tm_hour:02d}:{now.tm_min:02d}:{now.tm_sec:02d}"
+        return _TIME_FMT % (now.tm_hour, now.tm_min, now.tm_sec)
+    
+    def get_time_iso(self):
+        """
+        Get local time as ISO 8601 ASCII bytes (YYYY-MM-DDTHH:MM:SS)
+        
+        Digits are written straight into a reused 19-byte buffer, so this
+        allocates nothing. The returned bytearray is overwritten by the
+        next call; copy it with bytes() to keep it.
+        """
+        if not self.synced:
+            return _ISO_UNSYNCED
+        
+        now = time.localtime()
+        buf = self._ts_buf
+        v = now.tm_year
+        buf[0] = 0x30 + v // 1000
+        buf[1] = 0x30 + v // 100 % 10
+        buf[2] = 0x30 + v // 10 % 10
+        buf[3] = 0x30 + v % 10
+        v = now.tm_mon
+        buf[5] = 0x30 + v // 10
+        buf[6] = 0x30 + v % 10
+        v = now.tm_mday
+        buf[8] = 0x30 + v // 10
+        buf[9] = 0x30 + v % 10
+        v = now.tm_hour
+        buf[11] = 0x30 + v // 10
+        buf[12] = 0x30 + v % 10
+        v = now.tm_min
+        buf[14] = 0x30 + v // 10
+        buf[15] = 0x30 + v % 10
+        v = now.tm_sec
+        buf[17] = 0x30 + v // 10
+        buf[18] = 0x30 + v % 10
+        return buf
     
     def get_time(self):
         """Alias for get_time_string() for compatibility"""
@@ -187,7 +190,6 @@ class RTCHandler:
             return 0
         
         try:
-            import time
             # Get current time as struct_time
             now = time.localtime()
             
@@ -238,7 +240,7 @@ class RTCHandler:
             return "----------"
         
         now = time.localtime()
-        return f"{now.tm_year}-{now.tm_mon:02d}-{now.tm_mday:02d}"
+        return _DATE_FMT % (now.tm_year, now.tm_mon, now.tm_mday)
     
     def get_date(self):
         """Alias for get_date_string() for compatibility"""
@@ -5,15 +5,174 @@ Handles SD card initialization, session file management with sequential numberin
 """
 
 import os
+import struct
+import time
 import storage
 import sdcardio
 import busio
 import board
 
+# SPI clock tried first, then the fallbacks if the card will not come up
+SD_BAUDRATE = 24_000_000
+SD_BAUDRATE_FALLBACKS = (12_000_000, 8_000_000)
+
+# SDIO bus clock (4-bit mode moves four bits per clock instead of SPI's one)
+SDIO_FREQUENCY = 25_000_000
+
+# Session files are named "session_NNNNN.csv" / "session_NNNNN.opl"
+SESSION_PREFIX = "session_"
+_SESSION_NAME_FMT = SESSION_PREFIX + "%05d.%s"
+
+# Seconds a directory scan or stat result is reused before hitting FAT again
+SD_CACHE_TTL = 2.0
+
+# Bytes gathered in RAM before a log file write reaches FAT
+LOG_BUFFER_SIZE = 32768
+
+# Bytes AsyncSDWriter.poll() writes per call (a few sectors)
+SD_WRITE_CHUNK = 2048
+
+class BufferedLog:
+    """
+    Log file wrapper that batches small writes into one large FAT write
+    
+    Each write() through FatFS can stall for tens of milliseconds on an SPI
+    card, so per-sample writes are copied into a RAM buffer and only written
+    out when it fills, on flush(), or when flush_interval_s has elapsed.
+    
+    Writes triggered by a full buffer always end on a multiple of the buffer
+    size in the file, so with a cluster-sized buffer the card only ever sees
+    whole, aligned clusters (a flush() may leave a short write; the next
+    fill is shortened to get back onto the boundary).
+    """
+    
+    def __init__(self, file, buf_size=LOG_BUFFER_SIZE, flush_interval_s=None):
+        """
+        Wrap an open file
+        
+        Args:
+            file: File opened in binary mode
+            buf_size: Buffer size in bytes
+            flush_interval_s: Force a flush this often for crash safety (None disables)
+        """
+        self._file = file
+        self._buf = bytearray(buf_size)
+        self._mv = memoryview(self._buf)
+        self._size = buf_size
+        self._pos = 0
+        self._offset = 0            # Bytes already written to the file
+        self._limit = buf_size      # Fill level that lands on the next boundary
+        self.flush_interval_s = flush_interval_s
+        self._last_flush = time.monotonic()
+        self.truncate_on_close = False  # Set when the file was preallocated
+    
+    def _drain(self):
+        """Write buffered bytes to the file"""
+        if self._pos:
+            self._file.write(self._mv[:self._pos])
+            self._offset += self._pos
+            self._limit = self._size - self._offset % self._size
+            self._pos = 0
+    
+    def write(self, data):
+        """
+        Buffer data (str is UTF-8 encoded)
+        
+        Returns:
+            int: Number of bytes accepted
+        """
+        if isinstance(data, str):
+            data = data.encode()
+        n = len(data)
+        pos = self._pos
+        
+        if n <= self._limit - pos:
+            self._mv[pos:pos + n] = data
+            self._pos = pos + n
+        else:
+            # Top the buffer up to the boundary, write it, carry on with the rest
+            src = memoryview(data)
+            start = 0
+            while n - start > self._limit - self._pos:
+                take = self._limit - self._pos
+                self._mv[self._pos:self._limit] = src[start:start + take]
+                self._pos = self._limit
+                self._drain()
+                start += take
+            rest = n - start
+            self._mv[:rest] = src[start:]
+            self._pos = rest
+        
+        if self.flush_interval_s is not None:
+            self._flush_if_due()
+        return n
+    
+    def _flush_if_due(self):
+        """Flush if flush_interval_s has passed since the last flush"""
+        now = time.monotonic()
+        if now - self._last_flush >= self.flush_interval_s:
+            self.flush(now)
+    
+    def record_packer(self, fmt):
+        """
+        Build a function that packs one fixed-size record straight into the buffer
+        
+        Records are plain struct layouts laid end to end; the caller (e.g.
+        binary_logger for .opl) owns any framing around them. A record that
+        would straddle a write boundary is packed into a scratch buffer and
+        goes through write() so alignment is kept.
+        
+        Args:
+            fmt: struct format of one record, e.g. '<Ifff'
+        
+        Returns:
+            function: pack(*values) appending one record
+        """
+        size = struct.calcsize(fmt)
+        scratch = bytearray(size)
+        pack_into = struct.pack_into
+        buf = self._buf
+        
+        def pack(*values):
+            pos = self._pos
+            if size <= self._limit - pos:
+                pack_into(fmt, buf, pos, *values)
+                self._pos = pos + size
+                if self.flush_interval_s is not None:
+                    self._flush_if_due()
+            else:
+                pack_into(fmt, scratch, 0, *values)
+                self.write(scratch)
+        
+        return pack
+    
+    def flush(self, now=None):
+        """Write out buffered data and flush the file"""
+        self._drain()
+        self._file.flush()
+        self._last_flush = now if now is not None else time.monotonic()
+    
+    def close(self):
+        """Flush and close the file, trimming any preallocated tail"""
+        try:
+            self.flush()
+            if self.truncate_on_close:
+                self._file.truncate()
+        finally:
+            self._file.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
 class SDCard:
     """SD Card manager"""
     
-    def __init__(self, spi_sck=board.GP18, spi_mosi=board.GP19, spi_miso=board.GP16, cs=board.GP17):
+    def __init__(self, spi_sck=board.GP18, spi_mosi=board.GP19, spi_miso=board.GP16, cs=board.GP17,
+                 baudrate=SD_BAUDRATE, backend='auto', sdio_clk=None, sdio_cmd=None, sdio_data=None,
+                 cache_ttl=SD_CACHE_TTL):
         """
         Initialize SD card
         
@@ -22,34 +181,185 @@ class SDCard:
             spi_mosi: SPI MOSI pin
             spi_miso: SPI MISO pin
             cs: Chip select pin
+            baudrate: SPI clock used after card init (default 24 MHz)
+            backend: 'auto' (SDIO if wired and supported, else SPI), 'sdio' or 'spi'
+            sdio_clk: SDIO clock pin
+            sdio_cmd: SDIO command pin
+            sdio_data: Tuple of SDIO data pins, (D0,) or (D0, D1, D2, D3)
+            cache_ttl: Seconds to reuse session listings and file stats
+        
+        Note:
+            PIO-based SDIO on the RP2040 needs the data lines on consecutive
+            GPIOs and the clock two below D0: CLK = D0-2, D1..D3 = D0+1..D0+3.
         """
-        self.spi = busio.SPI(spi_sck, spi_mosi, spi_miso)
+        self._spi_pins = (spi_sck, spi_mosi, spi_miso)
+        self.spi = None
         self.cs = cs
+        self.baudrate = baudrate
+        self.backend = backend
+        self._sdio_pins = (sdio_clk, sdio_cmd, sdio_data)
         self.sdcard = None
         self.vfs = None
         self.mounted = False
         self.mount_point = "/sd"
+        self._dir_prefix = self.mount_point + "/"
+        self.au_size = 0            # Cluster size in bytes, read at mount
+        
+        # Metadata caches, dropped whenever we create or delete a session
+        self._cache_ttl = cache_ttl
+        self._stat_cache = {}       # filename -> (timestamp, size or None if missing)
+        self._list_cache = None     # (timestamp, with_sizes, scan result)
+        
+        # Session numbers only ever go up; scanned once per mount
+        self._next_session_num = None
+        
+    def _invalidate_cache(self):
+        """Forget cached listings and stats"""
+        self._stat_cache = {}
+        self._list_cache = None
+    
+    def _stat_size(self, filename):
+        """
+        Size of a file on the card, served from the stat cache when fresh
+        
+        Args:
+            filename: Filename (not full path)
+        
+        Returns:
+            int: Size in bytes, or None if the file does not exist
+        """
+        now = time.monotonic()
+        cached = self._stat_cache.get(filename)
+        if cached is not None and now - cached[0] < self._cache_ttl:
+            return cached[1]
+        
+        try:
+            size = os.stat(self._dir_prefix + filename)[6]
+        except OSError:
+            size = None
+        self._stat_cache[filename] = (now, size)
+        return size
+    
+    def _open_sdio(self):
+        """
+        Bring up the card over SDIO
+        
+        Returns:
+            sdioio.SDCard: Initialized card, or None if SDIO is unavailable
+        """
+        clk, cmd, data = self._sdio_pins
+        if clk is None or cmd is None or not data:
+            if self.backend == 'sdio':
+                print("[SD] SDIO backend requested but pins not set")
+            return None
+        
+        try:
+            import sdioio
+        except ImportError:
+            print("[SD] sdioio not available, using SPI")
+            return None
+        
+        try:
+            card = sdioio.SDCard(clock=clk, command=cmd, data=data, frequency=SDIO_FREQUENCY)
+            self.backend = 'sdio'
+            return card
+        except Exception as e:
+            print(f"[SD] SDIO init failed ({e}), using SPI")
+            return None
+    
+    def _open_card(self):
+        """
+        Bring up the card, preferring SDIO when configured
+        
+        Returns:
+            sdioio.SDCard or sdcardio.SDCard: Initialized card
+        """
+        if self.backend != 'spi':
+            card = self._open_sdio()
+            if card is not None:
+                return card
+        
+        return self._open_spi()
+    
+    def _open_spi(self):
+        """
+        Bring up the card at the requested SPI clock, stepping down on failure
         
+        Returns:
+            sdcardio.SDCard: Initialized card
+        """
+        if self.spi is None:
+            self.spi = busio.SPI(*self._spi_pins)
+        self.backend = 'spi'
+        
+        rates = [self.baudrate]
+        for rate in SD_BAUDRATE_FALLBACKS:
+            if rate < self.baudrate:
+                rates.append(rate)
+        
+        # sdcardio runs card init at a slow clock and only then switches to
+        # baudrate, so read block 0 to prove the card works at this rate
+        probe = bytearray(512)
+        for rate in rates:
+            card = None
+            try:
+                card = sdcardio.SDCard(self.spi, self.cs, baudrate=rate)
+                card.readblocks(0, probe)
+                self.baudrate = rate
+                return card
+            except OSError as e:
+                if card is not None:
+                    card.deinit()
+                if rate == rates[-1]:
+                    raise
+                print(f"[SD] {rate // 1_000_000} MHz failed ({e}), retrying slower")
+    
     def mount(self):
         """Mount SD card"""
         try:
-            self.sdcard = sdcardio.SDCard(self.spi, self.cs)
+            self.sdcard = self._open_card()
             self.vfs = storage.VfsFat(self.sdcard)
             storage.mount(self.vfs, self.mount_point)
             self.mounted = True
-            print(f"[SD] ✓ Mounted at {self.mount_point}")
+            self._dir_prefix = self.mount_point + "/"
+            self._invalidate_cache()
+            self._next_session_num = None
+            self.get_next_session_number()
+            self.au_size = self._read_au_size()
+            if self.backend == 'sdio':
+                print(f"[SD] ✓ Mounted at {self.mount_point} (SDIO)")
+            else:
+                print(f"[SD] ✓ Mounted at {self.mount_point} ({self.baudrate // 1_000_000} MHz)")
             return True
         except Exception as e:
             print(f"[SD] ✗ Mount failed: {e}")
             self.mounted = False
             return False
     
+    def _read_au_size(self):
+        """
+        Write granularity to align log buffers to
+        
+        sdcardio does not expose ACMD13, so the real erase AU is unknown;
+        the filesystem cluster size is the unit FAT allocates in and the
+        smallest write that never shares a cluster with another.
+        
+        Returns:
+            int: Cluster size in bytes, or 0 if unknown
+        """
+        try:
+            return os.statvfs(self.mount_point)[0]
+        except OSError:
+            return 0
+    
     def unmount(self):
         """Unmount SD card"""
         try:
             if self.mounted:
                 storage.umount(self.mount_point)
                 self.mounted = False
+                self._invalidate_cache()
+                self._next_session_num = None
                 print("[SD] Unmounted")
             return True
         except Exception as e:
@@ -80,7 +390,83 @@ class SDCard:
         _, free_bytes = self.get_capacity()
         return free_bytes / (1024 ** 3)
     
-    def list_sessions(self, pattern="session_"):
+    def _scan_sessions(self, pattern=SESSION_PREFIX, with_sizes=False):
+        """
+        Walk the mount point once and collect everything the session queries need
+        
+        Args:
+            pattern: Filename prefix to match (default: "session_")
+            with_sizes: Also stat each matching file for its size
+        
+        Returns:
+            tuple: (sorted session names, highest csv/opl session number,
+                    csv count, opl count, total size in bytes)
+        """
+        # Only the default listing is cached; a sized scan also serves unsized callers
+        cacheable = pattern == SESSION_PREFIX
+        now = time.monotonic()
+        if cacheable and self._list_cache is not None:
+            ts, has_sizes, result = self._list_cache
+            if now - ts < self._cache_ttl and (has_sizes or not with_sizes):
+                return result
+        
+        sessions = []
+        max_num = 0
+        csv_count = 0
+        opl_count = 0
+        total_size = 0
+        prefix_len = len(SESSION_PREFIX)
+        min_len = prefix_len + 4        # Prefix plus ".ext" with no digits
+        
+        # Bound once; the sized scan stats every session file
+        stat = os.stat
+        dir_prefix = self._dir_prefix
+        stat_cache = self._stat_cache
+        
+        for f in os.listdir(self.mount_point):
+            if not f.startswith(pattern):
+                continue
+            sessions.append(f)
+            
+            if with_sizes:
+                try:
+                    size = stat(dir_prefix + f)[6]
+                except OSError:
+                    # Gone since listdir: cache it as missing, count 0 bytes
+                    stat_cache[f] = (now, None)
+                else:
+                    stat_cache[f] = (now, size)
+                    total_size += size
+            
+            if not f.startswith(SESSION_PREFIX):
+                continue
+            
+            # Fixed layout "session_NNNNN.ext": slice the extension and the
+            # digits by offset instead of splitting into intermediate strings
+            ext = f[-4:]
+            if ext == ".csv":
+                csv_count += 1
+            elif ext == ".opl":
+                opl_count += 1
+            else:
+                continue
+            
+            if len(f) <= min_len:
+                continue
+            try:
+                num = int(f[prefix_len:-4])
+            except ValueError:
+                continue
+            if num > max_num:
+                max_num = num
+        
+        sessions.sort()
+        result = (sessions, max_num, csv_count, opl_count, total_size)
+        if cacheable:
+            self._list_cache = (now, with_sizes, result)
+        return result
+    
+    def list_sessions(self, pattern=SESSION_PREFIX):
         """
         List all session files
         
@@ -94,16 +480,17 @@ class SDCard:
             return []
         
         try:
-            files = os.listdir(self.mount_point)
-            sessions = [f for f in files if f.startswith(pattern)]
-            return sorted(sessions)
+            return list(self._scan_sessions(pattern)[0])
         except Exception as e:
             print(f"[SD] List sessions error: {e}")
             return []
     
     def get_next_session_number(self):
         """
-        Get next session number by scanning existing files
+        Get next session number
+        
+        Existing files are scanned once per mount; after that the number is
+        a counter advanced by create_session_filename.
         
         Returns:
             int: Next available session number (starting from 1)
@@ -111,32 +498,13 @@ class SDCard:
         if not self.mounted:
             return 1
         
-        try:
-            files = os.listdir(self.mount_point)
-            
-            # Find all session files (both .csv and .opl)
-            session_numbers = []
-            for f in files:
-                if f.startswith("session_") and (f.endswith(".csv") or f.endswith(".opl")):
-                    # Extract number from "session_NNNNN.ext"
-                    try:
-                        # Split by underscore and dot
-                        parts = f.replace(".csv", "").replace(".opl", "").split("_")
-                        if len(parts) >= 2:
-                            num = int(parts[1])
-                            session_numbers.append(num)
-                    except (ValueError, IndexError):
-                        continue
-            
-            # Return next number
-            if session_numbers:
-                return max(session_numbers) + 1
-            else:
+        if self._next_session_num is None:
+            try:
+                self._next_session_num = self._scan_sessions()[1] + 1
+            except Exception as e:
+                print(f"[SD] Get next session number error: {e}")
                 return 1
-                
-        except Exception as e:
-            print(f"[SD] Get next session number error: {e}")
-            return 1
+        return self._next_session_num
     
     def create_session_filename(self, extension="csv"):
         """
@@ -146,20 +514,24 @@ class SDCard:
             extension: File extension ('csv' or 'opl')
         
         Returns:
-            str: Full path to session file (e.g., "/sd/session_00001.csv")
+            tuple: (full_path, filename), e.g. ("/sd/session_00001.csv", "session_00001.csv")
         """
         if not self.mounted:
             raise OSError("SD card not mounted")
         
-        # Get next session number
+        # Take the next session number; deleted numbers are never reused
         session_num = self.get_next_session_number()
+        self._next_session_num = session_num + 1
         
         # Format with leading zeros (5 digits)
-        filename = f"session_{session_num:05d}.{extension}"
-        full_path = f"{self.mount_point}/{filename}"
+        filename = _SESSION_NAME_FMT % (session_num, extension)
+        full_path = self._dir_prefix + filename
+        
+        # The caller is about to create this file
+        self._invalidate_cache()
         
         print(f"[SD] Next session: {filename}")
-        return full_path
+        return (full_path, filename)
     
     def delete_session(self, filename):
         """
@@ -175,8 +547,9 @@ class SDCard:
             return False
         
         try:
-            full_path = f"{self.mount_point}/{filename}"
+            full_path = self._dir_prefix + filename
             os.remove(full_path)
+            self._invalidate_cache()
             print(f"[SD] Deleted: {filename}")
             return True
         except Exception as e:
@@ -196,12 +569,7 @@ class SDCard:
         if not self.mounted:
             return False
         
-        try:
-            full_path = f"{self.mount_point}/{filename}"
-            os.stat(full_path)
-            return True
-        except OSError:
-            return False
+        return self._stat_size(filename) is not None
     
     def get_file_size(self, filename):
         """
@@ -217,9 +585,7 @@ class SDCard:
             return 0
         
         try:
-            full_path = f"{self.mount_point}/{filename}"
-            stat = os.stat(full_path)
-            return stat[6]  # Size in bytes
+            return self._stat_size(filename) or 0
         except Exception as e:
             return 0
     
@@ -230,20 +596,17 @@ class SDCard:
         Returns:
             dict: Session statistics
         """
-        sessions = self.list_sessions()
-        
-        total_size = 0
+        sessions = []
         csv_count = 0
         opl_count = 0
+        total_size = 0
         
-        for session in sessions:
-            size = self.get_file_size(session)
-            total_size += size
-            
-            if session.endswith('.csv'):
-                csv_count += 1
-            elif session.endswith('.opl'):
-                opl_count += 1
+        if self.mounted:
+            try:
+                sessions, _, csv_count, opl_count, total_size = self._scan_sessions(with_sizes=True)
+                sessions = list(sessions)
+            except Exception as e:
+                print(f"[SD] Session info error: {e}")
         
         return {
             'total_sessions': len(sessions),
@@ -255,6 +618,222 @@ class SDCard:
         }
 
 
+class AsyncSDWriter:
+    """
+    Double-buffered log writer that keeps SD stalls out of the sample loop
+    
+    Samples are copied into the active buffer; when it fills, the buffers
+    swap and the full one is handed to poll(), which writes it out a chunk
+    at a time. The main loop calls poll() once per pass, so each pass pays
+    for at most one chunk write while the other buffer keeps filling.
+    CircuitPython on the RP2040 has no _thread, so this is the cooperative
+    form of a background writer.
+    """
+    
+    def __init__(self, file, buf_size=LOG_BUFFER_SIZE // 2, chunk_size=SD_WRITE_CHUNK,
+                 flush_interval_s=None):
+        """
+        Wrap an open file
+        
+        Args:
+            file: File opened in binary mode
+            buf_size: Size of each of the two buffers in bytes
+            chunk_size: Bytes written to the file per poll()
+            flush_interval_s: Hand a partly filled buffer to poll() this often (None disables)
+        """
+        self._file = file
+        self._mvs = (memoryview(bytearray(buf_size)), memoryview(bytearray(buf_size)))
+        self._size = buf_size
+        self._chunk = chunk_size
+        self._active = 0
+        self._pos = 0
+        self._pending = None        # memoryview still being written by poll()
+        self._pending_pos = 0
+        self.overruns = 0           # Times a full buffer had to be written inline
+        self.flush_interval_s = flush_interval_s
+        self._last_flush = time.monotonic()
+        self.truncate_on_close = False  # Set when the file was preallocated
+    
+    def _swap(self):
+        """Hand the active buffer to poll() and start filling the other one"""
+        if self._pending is not None:
+            # Writer fell behind: finish the old buffer now rather than lose data
+            self.overruns += 1
+            self._finish_pending()
+        self._pending = self._mvs[self._active][:self._pos]
+        self._pending_pos = 0
+        self._active ^= 1
+        self._pos = 0
+    
+    def _finish_pending(self):
+        """Write whatever is left of the pending buffer"""
+        if self._pending is not None:
+            self._file.write(self._pending[self._pending_pos:])
+            self._pending = None
+            self._file.flush()
+    
+    def write(self, data):
+        """
+        Queue data (str is UTF-8 encoded)
+        
+        Returns:
+            int: Number of bytes accepted
+        """
+        if isinstance(data, str):
+            data = data.encode()
+        n = len(data)
+        pos = self._pos
+        
+        if n <= self._size - pos:
+            self._mvs[self._active][pos:pos + n] = data
+            self._pos = pos + n
+        else:
+            src = memoryview(data)
+            start = 0
+            while n - start > self._size - self._pos:
+                take = self._size - self._pos
+                self._mvs[self._active][self._pos:] = src[start:start + take]
+                self._pos = self._size
+                self._swap()
+                start += take
+            rest = n - start
+            self._mvs[self._active][:rest] = src[start:]
+            self._pos = rest
+        return n
+    
+    append = write
+    
+    def record_packer(self, fmt):
+        """
+        Build a function that packs one fixed-size record straight into the active buffer
+        
+        Args:
+            fmt: struct format of one record, e.g. '<Ifff'
+        
+        Returns:
+            function: pack(*values) appending one record
+        """
+        size = struct.calcsize(fmt)
+        scratch = bytearray(size)
+        pack_into = struct.pack_into
+        
+        def pack(*values):
+            pos = self._pos
+            if size <= self._size - pos:
+                pack_into(fmt, self._mvs[self._active], pos, *values)
+                self._pos = pos + size
+            else:
+                pack_into(fmt, scratch, 0, *values)
+                self.write(scratch)
+        
+        return pack
+    
+    def poll(self, now=None):
+        """
+        Write the next chunk of the pending buffer; call once per main loop pass
+        
+        Args:
+            now: Current time.monotonic(), if the caller already has it
+        """
+        pending = self._pending
+        if pending is not None:
+            pos = self._pending_pos
+            end = pos + self._chunk
+            if end >= len(pending):
+                self._finish_pending()
+            else:
+                self._file.write(pending[pos:end])
+                self._pending_pos = end
+            return
+        
+        if self.flush_interval_s is not None and self._pos:
+            if now is None:
+                now = time.monotonic()
+            if now - self._last_flush >= self.flush_interval_s:
+                self._last_flush = now
+                self._swap()
+    
+    def flush(self):
+        """Write everything queued so far and flush the file"""
+        self._finish_pending()
+        if self._pos:
+            self._file.write(self._mvs[self._active][:self._pos])
+            self._pos = 0
+        self._file.flush()
+        self._last_flush = time.monotonic()
+    
+    def close(self):
+        """Flush and close the file, trimming any preallocated tail"""
+        try:
+            self.flush()
+            if self.truncate_on_close:
+                self._file.truncate()
+        finally:
+            self._file.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+def _preallocate(file, nbytes):
+    """
+    Reserve clusters for a new log file up front
+    
+    Seeking past the end and writing one byte makes FatFS allocate the whole
+    cluster chain now, instead of extending it mid-session on every cluster
+    boundary. The file is left positioned at 0 and must be truncated back
+    to its real length on close.
+    
+    Args:
+        file: Newly created file opened in binary mode
+        nbytes: Bytes to reserve
+    
+    Returns:
+        bool: True if the file was extended and can be truncated later
+    """
+    if nbytes <= 0:
+        return False
+    if not hasattr(file, 'truncate'):
+        # Without truncate the zero-filled tail would stay in the log
+        print("[SD] Preallocation skipped - file truncate not supported")
+        return False
+    
+    try:
+        file.seek(nbytes - 1)
+        file.write(b'\x00')
+        file.seek(0)
+        return True
+    except OSError as e:
+        print(f"[SD] Preallocation failed: {e}")
+        file.seek(0)
+        return False
+
+
+def _aligned_buffer_size(buf_size, au_size):
+    """
+    Adjust a log buffer size so its writes line up with the card's clusters
+    
+    Args:
+        buf_size: Requested buffer size in bytes
+        au_size: Cluster size in bytes (0 if unknown)
+    
+    Returns:
+        int: A multiple of au_size, or a power of two dividing it
+    """
+    if au_size <= 0:
+        return buf_size
+    if buf_size >= au_size:
+        return buf_size - buf_size % au_size
+    # Cluster sizes are powers of two, so any smaller power of two divides them
+    size = 512
+    while size * 2 <= buf_size:
+        size *= 2
+    return size
+
+
 # Convenience functions for backward compatibility
 _sd_card = None
 
@@ -268,28 +847,42 @@ def get_sdcard():
     """Get global SD card instance"""
     return _sd_card
 
-def create_log_file(extension="csv"):
+def create_log_file(extension="csv", buf_size=LOG_BUFFER_SIZE, flush_interval_s=None, async_=False,
+                    preallocate_mb=0):
     """
     Create a new log file with sequential numbering
     
     Args:
         extension: File extension ('csv' or 'opl')
+        buf_size: Write buffer size in bytes (rounded to fit the cluster size)
+        flush_interval_s: Periodic flush interval in seconds (None: only when full)
+        async_: Return an AsyncSDWriter (buf_size split over its two buffers);
+                the caller must then call poll() every main loop pass
+        preallocate_mb: Reserve this many MiB for the file up front; the
+                        unused tail is truncated on close() (a file that is
+                        never closed keeps a zero-filled tail)
     
     Returns:
-        tuple: (file_object, filename) or (None, None) on error
+        tuple: (BufferedLog or AsyncSDWriter, filename) or (None, None) on error
     """
     if not _sd_card or not _sd_card.mounted:
         print("[SD] Cannot create log file - SD card not mounted")
         return (None, None)
     
     try:
-        filepath = _sd_card.create_session_filename(extension)
+        filepath, filename = _sd_card.create_session_filename(extension)
         
-        # Open file for writing
-        log_file = open(filepath, 'w' if extension == 'csv' else 'wb')
+        # Binary for both formats; the writers encode CSV text themselves
+        raw_file = open(filepath, 'wb')
+        preallocated = _preallocate(raw_file, preallocate_mb * 1024 * 1024)
         
-        # Extract just the filename
-        filename = filepath.split('/')[-1]
+        if async_:
+            buf_size = _aligned_buffer_size(buf_size // 2, _sd_card.au_size)
+            log_file = AsyncSDWriter(raw_file, buf_size, flush_interval_s=flush_interval_s)
+        else:
+            buf_size = _aligned_buffer_size(buf_size, _sd_card.au_size)
+            log_file = BufferedLog(raw_file, buf_size, flush_interval_s)
+        log_file.truncate_on_close = preallocated
         
         print(f"[SD] ✓ Created: {filename}")
         return (log_file, filename)
@@ -316,8 +909,8 @@ if init_sdcard():
     sessions = sd.list_sessions()
     print(f"Found {len(sessions)} sessions")
     
-    # Create new CSV log
-    log_file, filename = create_log_file('csv')
+    # Create new CSV log (buffered; flushed at least every 5 s)
+    log_file, filename = create_log_file('csv', flush_interval_s=5.0)
     if log_file:
         log_file.write("timestamp,data\n")
         log_file.close()
@@ -328,6 +921,21 @@ if init_sdcard():
         log_file.write(b'OPNY')
         log_file.close()
     
+    # Fixed-size records packed straight into the write buffer
+    log_file, filename = create_log_file('opl')
+    if log_file:
+        pack_imu = log_file.record_packer('<Ifff')   # timestamp_ms, gx, gy, gz
+        pack_imu(1000, 0.01, -0.02, 1.0)
+        log_file.close()
+    
+    # Double-buffered: SD writes happen a chunk at a time in poll()
+    log_file, filename = create_log_file('opl', async_=True, flush_interval_s=5.0)
+    if log_file:
+        for i in range(1000):
+            log_file.append(b'sample..')
+            log_file.poll()
+        log_file.close()
+    
     # Get session statistics
     info = sd.get_session_info()
     print(f"Total sessions: {info['total_sessions']}")
@@ -5,39 +5,159 @@ serial_com.py - JSON Protocol Handler for OpenPonyLogger
 import json
 import time
 
+# Maximum UART reads drained per process() call
+MAX_READS_PER_POLL = 4
+
+# Delay between file_chunk messages (gives the ESP-01S time to forward)
+CHUNK_INTERVAL = 0.05
+
+# Fixed responses, encoded once
+_ERR_MISSING_FILE = b'{"type": "error", "message": "Missing file parameter"}\n'
+_ERR_DELETE_FAILED = b'{"type": "error", "message": "Delete failed"}\n'
+_ERR_NO_SESSION = b'{"type": "error", "message": "No active session"}\n'
+_ERR_TRANSFER_BUSY = b'{"type": "error", "message": "Transfer in progress"}\n'
+_OK_FILE_DELETED = b'{"type": "ok", "message": "File deleted"}\n'
+
+# Telemetry fields that need full coordinate precision
+_COORD_KEYS = ('lat', 'lon')
+
+
+def _utf8_complete(buf, n):
+    """
+    Length of buf[:n] up to the last complete UTF-8 character
+    
+    A fixed-size binary read can end part way through a multibyte
+    character; the 1-3 bytes after the returned length belong to the
+    next chunk.
+    """
+    i = n - 1
+    # Step back over continuation bytes (at most 3)
+    while i >= 0 and n - i <= 3 and (buf[i] & 0xC0) == 0x80:
+        i -= 1
+    if i < 0:
+        return n
+    lead = buf[i]
+    if lead < 0xC0:
+        return n
+    need = 2 if lead < 0xE0 else 3 if lead < 0xF0 else 4
+    return i if i + need > n else n
+
+
+def _encode_section(section):
+    """
+    Encode one telemetry section (flat dict of scalars) as JSON
+    
+    Floats are written with fixed precision (6 places for coordinates,
+    3 for everything else) so the UART payload doesn't carry long
+    mantissas. Only strings go through json.dumps for escaping.
+    """
+    parts = []
+    for key, value in section.items():
+        if value is True:
+            enc = "true"
+        elif value is False:
+            enc = "false"
+        elif isinstance(value, float):
+            enc = ("%.6f" if key in _COORD_KEYS else "%.3f") % value
+        elif isinstance(value, int):
+            enc = str(value)
+        else:
+            enc = json.dumps(value)
+        parts.append('"%s": %s' % (key, enc))
+    return "{" + ", ".join(parts) + "}"
+
+
+def _encode_update(data):
+    """Encode a telemetry update message (dict of sections) as JSON"""
+    sections = []
+    for name, section in data.items():
+        if isinstance(section, dict):
+            enc = _encode_section(section)
+        else:
+            enc = json.dumps(section)
+        sections.append('"%s": %s' % (name, enc))
+    return '{"type": "update", "data": {' + ", ".join(sections) + "}}\n"
+
+
 class JSONProtocol:
     """Handle JSON commands from ESP-01S"""
     
-    def __init__(self, uart, session, gps):
+    def __init__(self, uart, session, gps, blocking_transfers=False):
         self.uart = uart
         self.session = session
         self.gps = gps
         self.buffer = ""
         self.chunk_size = 512
+        
+        # Reusable read buffer for file transfers (avoids a new bytes per chunk)
+        self._file_buf = bytearray(self.chunk_size)
+        self._file_mv = memoryview(self._file_buf)
+        
+        # File transfer state. By default a GET sends one chunk per
+        # process() call so the main loop keeps sampling during a download;
+        # blocking_transfers=True restores the old send-everything-now path.
+        self.blocking_transfers = blocking_transfers
+        self._xfer_file = None
+        self._xfer_name = None
+        self._xfer_fmt = None
+        self._xfer_chunk = 0
+        self._xfer_next = 0
+        self._xfer_carry = 0        # Bytes of a split UTF-8 character held over
+        
+        # Command dispatch table (one dict lookup per command)
+        self._commands = {
+            "LIST": self._cmd_list,
+            "GET": self._cmd_get,
+            "DELETE": self._cmd_delete,
+            "START_SESSION": self._cmd_start_session,
+            "STOP_SESSION": self._cmd_stop_session,
+            "GET_SATELLITES": self._cmd_get_satellites,
+        }
     
     def process(self):
-        """Check for incoming commands"""
+        """Check for incoming commands and advance any file transfer"""
+        if self._xfer_file is not None:
+            self._send_next_chunk()
+        
         if self.uart.in_waiting:
             try:
-                # Read available bytes
-                data = self.uart.read(self.uart.in_waiting)
-                
-                # Decode with error handling
-                try:
-                    decoded = data.decode('utf-8')
-                except UnicodeError:
-                    # Try with 'ignore' error handler
-                    decoded = data.decode('utf-8', 'ignore')
-                    print("Warning: Ignored invalid UTF-8 bytes")
+                # Anything already buffered is a partial line (no newline),
+                # so the newline search only needs to cover new data
+                scan = len(self.buffer)
                 
-                self.buffer += decoded
+                # Drain the UART (bounded) so a burst of commands is handled
+                # in one poll instead of one read per main-loop tick
+                for _ in range(MAX_READS_PER_POLL):
+                    waiting = self.uart.in_waiting
+                    if not waiting:
+                        break
+                    data = self.uart.read(waiting)
+                    if not data:
+                        break
+                    
+                    # Decode with error handling
+                    try:
+                        decoded = data.decode('utf-8')
+                    except UnicodeError:
+                        # Try with 'ignore' error handler
+                        decoded = data.decode('utf-8', 'ignore')
+                        print("Warning: Ignored invalid UTF-8 bytes")
+                    
+                    self.buffer += decoded
                 
-                # Process complete JSON objects (newline delimited)
-                while '\n' in self.buffer:
-                    line, self.buffer = self.buffer.split('\n', 1)
-                    line = line.strip()
+                # Process complete JSON objects (newline delimited), walking
+                # the buffer by offset and trimming it once at the end
+                buf = self.buffer
+                start = 0
+                end = buf.find('\n', scan)
+                while end >= 0:
+                    line = buf[start:end].strip()
+                    start = end + 1
                     if line:
                         self.handle_line(line)
+                    end = buf.find('\n', start)
+                if start:
+                    self.buffer = buf[start:]
                         
             except Exception as e:
                 print(f"Serial process error: {e}")
@@ -60,52 +180,9 @@ class JSONProtocol:
         """Execute command"""
         try:
             cmd_type = cmd.get("cmd", "")
-            
-            if cmd_type == "LIST":
-                self.send_file_list()
-            
-            elif cmd_type == "GET":
-                filename = cmd.get("file", "")
-                if filename:
-                    self.send_file(filename)
-                else:
-                    self.send_error("Missing file parameter")
-            
-            elif cmd_type == "DELETE":
-                filename = cmd.get("file", "")
-                if filename:
-                    success = FileManager.delete_file(filename)
-                    if success:
-                        self.send_response({"type": "ok", "message": "File deleted"})
-                    else:
-                        self.send_error("Delete failed")
-                else:
-                    self.send_error("Missing file parameter")
-            
-            elif cmd_type == "START_SESSION":
-                driver = cmd.get("driver", "Unknown")
-                vin = cmd.get("vin", "Unknown")
-                filename = self.session.start(driver, vin)
-                self.send_response({
-                    "type": "ok",
-                    "message": "Session started",
-                    "file": filename
-                })
-            
-            elif cmd_type == "STOP_SESSION":
-                if self.session.active:
-                    filename = self.session.stop()
-                    self.send_response({
-                        "type": "ok",
-                        "message": "Session stopped",
-                        "file": filename
-                    })
-                else:
-                    self.send_error("No active session")
-            
-            elif cmd_type == "GET_SATELLITES":
-                self.send_satellites()
-            
+            handler = self._commands.get(cmd_type)
+            if handler:
+                handler(cmd)
             else:
                 print(f"Unknown command: {cmd_type}")
                 
@@ -113,6 +190,57 @@ class JSONProtocol:
             print(f"Command handling error: {e}")
             self.send_error(f"Error: {e}")
     
+    def _cmd_list(self, cmd):
+        """LIST - send session file list"""
+        self.send_file_list()
+    
+    def _cmd_get(self, cmd):
+        """GET - send file contents"""
+        filename = cmd.get("file", "")
+        if filename:
+            self.send_file(filename)
+        else:
+            self.send_raw(_ERR_MISSING_FILE)
+    
+    def _cmd_delete(self, cmd):
+        """DELETE - remove a session file"""
+        filename = cmd.get("file", "")
+        if filename:
+            success = FileManager.delete_file(filename)
+            if success:
+                self.send_raw(_OK_FILE_DELETED)
+            else:
+                self.send_raw(_ERR_DELETE_FAILED)
+        else:
+            self.send_raw(_ERR_MISSING_FILE)
+    
+    def _cmd_start_session(self, cmd):
+        """START_SESSION - begin logging"""
+        driver = cmd.get("driver", "Unknown")
+        vin = cmd.get("vin", "Unknown")
+        filename = self.session.start(driver, vin)
+        self.send_response({
+            "type": "ok",
+            "message": "Session started",
+            "file": filename
+        })
+    
+    def _cmd_stop_session(self, cmd):
+        """STOP_SESSION - end logging"""
+        if self.session.active:
+            filename = self.session.stop()
+            self.send_response({
+                "type": "ok",
+                "message": "Session stopped",
+                "file": filename
+            })
+        else:
+            self.send_raw(_ERR_NO_SESSION)
+    
+    def _cmd_get_satellites(self, cmd):
+        """GET_SATELLITES - send satellite data"""
+        self.send_satellites()
+    
     def send_file_list(self):
         """Send list of session files"""
         try:
@@ -129,49 +257,91 @@ class JSONProtocol:
     
     def send_file(self, filename):
         """Send file contents in chunks"""
+        if self._xfer_file is not None:
+            self.send_raw(_ERR_TRANSFER_BUSY)
+            return
+        
         filepath = f"/sd/{filename}"
         
         try:
-            stat = os.stat(filepath)
-            file_size = stat[6]
+            # Open directly (a missing file raises OSError here) and take
+            # the size from the open handle instead of a separate os.stat
+            f = open(filepath, 'rb')
+        except OSError as e:
+            print(f"File error: {e}")
+            self.send_error(f"File error: {e}")
+            return
+        
+        try:
+            file_size = f.seek(0, 2)
+            f.seek(0)
             
-            # Send file start
-            self.send_json({
-                "type": "file_start",
-                "file": filename,
-                "size": file_size
-            })
+            # The file name is the only field that needs JSON escaping;
+            # encode it once and fill the integer fields with %d
+            name_json = json.dumps(filename)
             
-            # Send file data in chunks
-            with open(filepath, 'r') as f:
-                chunk_num = 0
-                while True:
-                    chunk = f.read(self.chunk_size)
-                    if not chunk:
-                        break
-                    
-                    self.send_json({
-                        "type": "file_chunk",
-                        "file": filename,
-                        "chunk": chunk_num,
-                        "data": chunk
-                    })
-                    chunk_num += 1
-                    time.sleep(0.05)  # Small delay between chunks
+            # Send file start
+            self.uart.write(('{"type": "file_start", "file": %s, "size": %d}\n' % (name_json, file_size)).encode('utf-8'))
+        except Exception as e:
+            f.close()
+            print(f"Send file error: {e}")
+            self.send_error(f"Error: {e}")
+            return
+        
+        self._xfer_file = f
+        self._xfer_name = name_json
+        # Chunk message template: the file name is baked in once, only
+        # the chunk number and data are filled per chunk
+        self._xfer_fmt = '{"type": "file_chunk", "file": %s, "chunk": %%d, "data": %%s}\n' % name_json.replace('%', '%%')
+        self._xfer_chunk = 0
+        self._xfer_next = 0
+        self._xfer_carry = 0
+        
+        if self.blocking_transfers:
+            while self._xfer_file is not None:
+                self._send_next_chunk()
+                time.sleep(CHUNK_INTERVAL)
+    
+    def _send_next_chunk(self):
+        """Send the next chunk of the active transfer (file_end when done)"""
+        now = time.monotonic()
+        if now < self._xfer_next:
+            return
+        
+        try:
+            # Read into the shared buffer, after any bytes carried over
+            carry = self._xfer_carry
+            n = carry + (self._xfer_file.readinto(self._file_mv[carry:]) or 0)
+            if n:
+                # Only decode whole characters; at EOF send whatever is left
+                end = _utf8_complete(self._file_buf, n) if n > carry else n
+                chunk = str(self._file_mv[:end], 'utf-8')
+                self._xfer_carry = n - end
+                if self._xfer_carry:
+                    self._file_buf[:self._xfer_carry] = bytes(self._file_mv[end:n])
+                msg = self._xfer_fmt % (self._xfer_chunk, json.dumps(chunk))
+                self.uart.write(msg.encode('utf-8'))
+                self._xfer_chunk += 1
+                self._xfer_next = now + CHUNK_INTERVAL
+                return
             
             # Send file end
-            self.send_json({
-                "type": "file_end",
-                "file": filename,
-                "chunks": chunk_num
-            })
-            
-        except OSError as e:
-            print(f"File error: {e}")
-            self.send_error(f"File error: {e}")
+            self.uart.write(('{"type": "file_end", "file": %s, "chunks": %d}\n' % (self._xfer_name, self._xfer_chunk)).encode('utf-8'))
         except Exception as e:
             print(f"Send file error: {e}")
             self.send_error(f"Error: {e}")
+        
+        self._end_transfer()
+    
+    def _end_transfer(self):
+        """Close the active transfer's file"""
+        try:
+            self._xfer_file.close()
+        except Exception:
+            pass
+        self._xfer_file = None
+        self._xfer_name = None
+        self._xfer_fmt = None
     
     def send_satellites(self):
         """Send satellite data"""
@@ -194,6 +364,13 @@ class JSONProtocol:
         except Exception as e:
             print(f"Error sending error: {e}")
     
+    def send_raw(self, message):
+        """Send a pre-encoded message (bytes, newline terminated)"""
+        try:
+            self.uart.write(message)
+        except Exception as e:
+            print(f"Raw send error: {e}")
+    
     def send_json(self, obj):
         """Send JSON object"""
         try:
@@ -204,8 +381,7 @@ class JSONProtocol:
 
     def send_telemetry(self, data):
         """Send JSON update message to ESP"""
-        msg = {
-            "type": "update",
-            "data": data
-        }
-        self.send_json(msg)
+        try:
+            self.uart.write(_encode_update(data).encode('utf-8'))
+        except Exception as e:
+            print(f"Telemetry send error: {e}")
@@ -10,13 +10,21 @@ from config import config
 
 # Import binary logger
 try:
-    from binary_logger import BinaryLogger, WEATHER_UNKNOWN
+    from binary_logger import BinaryLogger, WEATHER_UNKNOWN, FLUSH_GFORCE_THRESHOLD
     BINARY_AVAILABLE = True
 except ImportError:
     BINARY_AVAILABLE = False
+    FLUSH_GFORCE_THRESHOLD = 0  # Placeholder default; the wrapper is unusable without binary_logger
     print("[SessionLogger] Binary logging not available")
 
 
+# CSV data row: timestamp, gx, gy, gz, g_total, lat, lon, alt, speed, sats, hdop
+_CSV_ROW_FMT = "%d,%.3f,%.3f,%.3f,%.3f,%.6f,%.6f,%.1f,%.1f,0,%.1f\n"
+
+# CSV rows buffered in memory between file writes
+CSV_FLUSH_SAMPLES = 50
+
+
 # =============================================================================
 # Session Numbering (shared by both CSV and Binary formats)
 # =============================================================================
@@ -130,6 +138,11 @@ class CSVLogger:
         self.start_time = None
         self.bytes_written = 0
         self.active = False
+        self._pending_lines = []
+        # Last accelerometer reading, paired with the next GPS row
+        # (1g down until the first reading arrives)
+        self._last_accel = (0.0, 0.0, 1.0)
+        self._last_accel_time = 0
     
     def start_session(self, session_name="", driver_name="", vehicle_id="", **kwargs):
         """Start new CSV logging session"""
@@ -153,6 +166,7 @@ class CSVLogger:
         self.bytes_written = len(header)
         self.active = True
         self.sample_count = 0
+        self._pending_lines = []
         self.start_time = time.monotonic()
         
         print(f"[CSVLog] Session started: {self.log_filename}")
@@ -176,27 +190,30 @@ class CSVLogger:
         timestamp = timestamp_us or int(time.monotonic() * 1000000)
         
         # Get last accelerometer data
-        if hasattr(self, '_last_accel'):
-            gx, gy, gz = self._last_accel
-        else:
-            gx, gy, gz = 0.0, 0.0, 1.0
-        
-        g_total = (gx**2 + gy**2 + gz**2)**0.5
+        gx, gy, gz = self._last_accel
         
-        # Write CSV line
-        line = f"{timestamp},{gx:.3f},{gy:.3f},{gz:.3f},{g_total:.3f},"
-        line += f"{lat:.6f},{lon:.6f},{alt:.1f},{speed:.1f},0,{hdop:.1f}\n"
+        g_total = (gx * gx + gy * gy + gz * gz) ** 0.5
         
-        self.log_file.write(line)
+        # Format CSV line from the module template and buffer it
+        line = _CSV_ROW_FMT % (timestamp, gx, gy, gz, g_total,
+                               lat, lon, alt, speed, hdop)
+        self._pending_lines.append(line)
         self.bytes_written += len(line)
         self.sample_count += 1
         
-        # Flush every 50 samples
-        if self.sample_count % 50 == 0:
-            self.log_file.flush()
+        # Write and flush every CSV_FLUSH_SAMPLES samples
+        if len(self._pending_lines) >= CSV_FLUSH_SAMPLES:
+            self._write_pending()
         
         return True
     
+    def _write_pending(self):
+        """Write buffered CSV lines to the file in one call and flush"""
+        if self._pending_lines:
+            self.log_file.write(''.join(self._pending_lines))
+            self._pending_lines = []
+        self.log_file.flush()
+    
     def write_gps_satellites(self, satellites, timestamp_us=None):
         """GPS satellites (not logged in CSV format)"""
         pass
@@ -206,7 +223,7 @@ class CSVLogger:
         if not self.active:
             return
         
-        self.log_file.flush()
+        self._write_pending()
         self.log_file.close()
         
         duration = time.monotonic() - self.start_time if self.start_time else 0
@@ -240,9 +257,9 @@ class BinaryLoggerWrapper:
     This ensures both CSV and Binary formats use the same numbering scheme
     """
     
-    def __init__(self, base_path="/sd"):
+    def __init__(self, base_path="/sd", gforce_threshold=FLUSH_GFORCE_THRESHOLD):
         self.base_path = base_path
-        self.logger = BinaryLogger(base_path)
+        self.logger = BinaryLogger(base_path, gforce_threshold)
     
     def start_session(self, session_name="", driver_name="", vehicle_id="",
                      weather=None, ambient_temp=0, config_crc=0, include_hardware=True):
@@ -320,7 +337,7 @@ class SessionLogger:
         # Create appropriate logger
         if self.format == 'binary' and BINARY_AVAILABLE:
             print(f"[SessionLogger Debug] Creating BinaryLoggerWrapper...")
-            self.logger = BinaryLoggerWrapper(base_path)
+            self.logger = BinaryLoggerWrapper(base_path, config.gforce_event_threshold)
             print(f"[SessionLogger Debug] Created logger type: {type(self.logger)}")
             print(f"[SessionLogger Debug] Logger is BinaryLoggerWrapper: {isinstance(self.logger, BinaryLoggerWrapper)}")
             print(f"[SessionLogger] Using binary format")
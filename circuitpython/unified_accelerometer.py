@@ -123,7 +123,7 @@ class UnifiedAccelerometer:
             str: Formatted string
         """
         gx, gy, gz = self.get_g_forces()
-        return f"X:{gx:+.2f}g Y:{gy:+.2f}g Z:{gz:+.2f}g"
+        return "X:%+.2fg Y:%+.2fg Z:%+.2fg" % (gx, gy, gz)
     
     def check_tap(self):
         """